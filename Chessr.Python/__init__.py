@@ -1,8 +1,12 @@
 import os
-
-from src.master import Master
+import sys
 
 os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = 'hide'
 
 if __name__ == '__main__':
-    Master()
+    if '--profile-startup' in sys.argv[1:]:
+        from src.tools.profile_startup import main # pylint: disable=import-outside-toplevel
+        main()
+    else:
+        from src.master import Master # pylint: disable=import-outside-toplevel
+        Master().run()
@@ -0,0 +1,8 @@
+import os
+
+from src.tools.build_asset_pack import main
+
+os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = 'hide'
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,4 @@
+from src.tools.build_board_pack import main
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,7 @@
 from typing import Iterable, Optional
 
 from backend import Piece, Player
-from src.logic.piece_data import PieceData
+from src.core.piece_data import PieceData
 
 
 class BoardData:
@@ -1,11 +1,13 @@
+import os
 from typing import Optional, cast
 
 from backend import PieceConfiguration, Player
-from src.engine.factory import Factory
-from src.engine.file_manager import PathLike
-from src.logic.board_data import BoardData, PieceData
+from src.core.board_data import BoardData, PieceData
+from src.core.data_file import read_data_file
 from src.utils.helpers import IntVector
+from src.utils.path import Path, PathLike
 
+BOARDS_FOLDER = Path(('files', 'boards'))
 
 class BoardLoader:
 
@@ -13,7 +15,7 @@ class BoardLoader:
         self.__piece_configuration = piece_configuration
 
     def load_board(self, path : PathLike) -> BoardData:
-        file_data = Factory.get().file_manager.load_board(path)
+        file_data = read_data_file(BOARDS_FOLDER.get_relative_path(path).get_literal_path())
         if file_data is None:
             return self.__get_invalid_board(path, 'The file could not be loaded.')
         
@@ -76,6 +78,18 @@ class BoardLoader:
             description,
             pieces)
 
+    @staticmethod
+    def get_board_paths(pathlike : PathLike = BOARDS_FOLDER) -> tuple[Path, ...]:
+        path = Path(pathlike).get_literal_path()
+        paths : list[Path] = []
+        for name in os.listdir(path):
+            path_object = Path((path, name))
+            if os.path.isfile(path_object.get_literal_path()):
+                paths.append(path_object)
+            else:
+                paths.extend(BoardLoader.get_board_paths(path_object))
+        return tuple(paths)
+
 #region Private Methods
 
     def __get_player_from_text(self, c : str) -> Optional[Player]:
@@ -0,0 +1,281 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+from typing import Any, Optional
+
+from backend import PieceConfiguration, PieceType, Player
+from src.core.board_data import BoardData, PieceData
+from src.core.board_loader import BOARDS_FOLDER, BoardLoader
+from src.utils.path import Path, PathLike
+
+BOARD_PACK_MAGIC = b'CHSRBRDS'
+BOARD_PACK_VERSION = 2
+BOARD_PACK_HEADER = struct.Struct('<8sII8s')
+BOARD_PACK_ALIGNMENT = 8
+PIECE_RECORD = struct.Struct('<BBHH')
+
+PLAYERS = { int(x): x for x in (Player.WHITE, Player.BLACK) }
+PIECE_TYPES = { int(x): x for x in PieceType.__members__.values() }
+ENUM_DIGEST = hashlib.sha1(json.dumps({
+    'players': sorted((k, int(v)) for (k, v) in Player.__members__.items()),
+    'piece_types': sorted((k, int(v)) for (k, v) in PieceType.__members__.items())
+}).encode('utf8')).digest()[:8]
+
+class BoardPackEntry:
+
+    def __init__(self, data : dict[str, Any]) -> None:
+        self.__key : str = data['path']
+        self.__mtime : int = data['mtime']
+        self.__size : int = data['size']
+        self.__valid : bool = data['valid']
+        self.__name : str = data['name']
+        self.__description : str = data['desc']
+        self.__width : int = data['w']
+        self.__height : int = data['h']
+        self.__starting_turn = PLAYERS[data['turn']]
+        self.__offset : int = data['offset']
+        self.__piece_count : int = data['count']
+
+    @property
+    def key(self) -> str:
+        return self.__key
+
+    @property
+    def stamp(self) -> tuple[int, int]:
+        return (self.__mtime, self.__size)
+
+    @property
+    def valid(self) -> bool:
+        return self.__valid
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @property
+    def description(self) -> str:
+        return self.__description
+
+    @property
+    def width(self) -> int:
+        return self.__width
+
+    @property
+    def height(self) -> int:
+        return self.__height
+
+    @property
+    def starting_turn(self) -> Player:
+        return self.__starting_turn
+
+    @property
+    def offset(self) -> int:
+        return self.__offset
+
+    @property
+    def piece_count(self) -> int:
+        return self.__piece_count
+
+class BoardPack:
+
+    def __init__(
+        self,
+        pathlike : PathLike = ('cache', 'boards.pack'),
+        boards_folder : PathLike = BOARDS_FOLDER
+    ) -> None:
+        self.__path = Path(pathlike).get_literal_path()
+        self.__boards_folder = Path(boards_folder)
+        self.__buffer : Optional[mmap.mmap | bytes] = None
+        self.__data_start = 0
+        self.__entries : dict[str, BoardPackEntry] = {}
+        self.__order : tuple[str, ...] = ()
+
+    def sync(self, piece_configuration : PieceConfiguration) -> bool:
+        stamps = self.__get_stamps()
+        if self.__open() and self.__is_current(stamps):
+            self.__order = tuple(stamps.keys())
+            return False
+
+        data = self.__pack(piece_configuration, stamps)
+        try:
+            self.__write(data)
+            loaded = self.__open()
+        except OSError:
+            loaded = self.__load(data)
+        if not loaded:
+            raise SystemExit(f'The board pack \'{self.__path}\' could not be read after building it.')
+        self.__order = tuple(stamps.keys())
+        return True
+
+    def open(self) -> bool:
+        if not self.__open():
+            return False
+        self.__order = tuple(self.__get_stamps().keys())
+        return True
+
+    def build(
+        self,
+        piece_configuration : PieceConfiguration,
+        stamps : Optional[dict[str, tuple[int, int]]] = None
+    ) -> None:
+        self.__write(self.__pack(piece_configuration, stamps))
+
+    def close(self) -> None:
+        if isinstance(self.__buffer, mmap.mmap):
+            self.__buffer.close()
+        self.__buffer = None
+        self.__entries = {}
+
+    def get_entries(self) -> tuple[BoardPackEntry, ...]:
+        return tuple(self.__entries[x] for x in self.__order if x in self.__entries)
+
+    def get_entry(self, path : PathLike) -> Optional[BoardPackEntry]:
+        return self.__entries.get(self.__get_key(path), None)
+
+    def load_board(self, entry : BoardPackEntry) -> BoardData:
+        pieces = [
+            PieceData(PIECE_TYPES[piece_type], PLAYERS[player], (i, j))
+            for (player, piece_type, i, j) in PIECE_RECORD.iter_unpack(self.__read_pieces(entry))
+        ]
+        return BoardData(
+            entry.valid,
+            entry.width,
+            entry.height,
+            entry.starting_turn,
+            entry.name,
+            entry.description,
+            pieces)
+
+    def __pack(
+        self,
+        piece_configuration : PieceConfiguration,
+        stamps : Optional[dict[str, tuple[int, int]]] = None
+    ) -> bytes:
+        stamps = self.__get_stamps() if stamps is None else stamps
+        board_loader = BoardLoader(piece_configuration)
+
+        entries : list[dict[str, Any]] = []
+        buffers : list[bytes] = []
+        offset = 0
+        for (key, stamp) in stamps.items():
+            previous = self.__entries.get(key, None)
+            if not previous is None and previous.stamp == stamp:
+                data = self.__read_pieces(previous)
+                board = {
+                    'valid': previous.valid,
+                    'name': previous.name,
+                    'desc': previous.description,
+                    'w': previous.width,
+                    'h': previous.height,
+                    'turn': int(previous.starting_turn),
+                    'count': previous.piece_count
+                }
+            else:
+                board_data = board_loader.load_board(self.__get_path(key))
+                data = b''.join(
+                    PIECE_RECORD.pack(int(x.player), int(x.type), *x.gxy) for x in board_data.pieces)
+                board = {
+                    'valid': board_data.valid,
+                    'name': board_data.name,
+                    'desc': board_data.description,
+                    'w': board_data.width,
+                    'h': board_data.height,
+                    'turn': int(board_data.starting_turn),
+                    'count': len(board_data.pieces)
+                }
+
+            entries.append({ 'path': key, 'mtime': stamp[0], 'size': stamp[1], 'offset': offset, **board })
+            buffers.append(data)
+            offset += len(data)
+
+        index = json.dumps({ 'entries': entries }).encode('utf8')
+        header = BOARD_PACK_HEADER.pack(BOARD_PACK_MAGIC, BOARD_PACK_VERSION, len(index), ENUM_DIGEST) + index
+        header += bytes(-len(header) % BOARD_PACK_ALIGNMENT)
+        return b''.join((header, *buffers))
+
+    def __write(self, data : bytes) -> None:
+        self.close()
+        os.makedirs(os.path.dirname(self.__path), exist_ok = True)
+        temporary_path = self.__path + '.tmp'
+        with open(temporary_path, 'wb') as file:
+            file.write(data)
+        os.replace(temporary_path, self.__path)
+
+    def __read_pieces(self, entry : BoardPackEntry) -> bytes:
+        if self.__buffer is None:
+            raise SystemExit('The board pack is not open.')
+        start = self.__data_start + entry.offset
+        return self.__buffer[start:start + entry.piece_count * PIECE_RECORD.size]
+
+    def __open(self) -> bool:
+        self.close()
+        if not os.path.isfile(self.__path) or os.path.getsize(self.__path) < BOARD_PACK_HEADER.size:
+            return False
+
+        with open(self.__path, 'rb') as file:
+            buffer = mmap.mmap(file.fileno(), 0, access = mmap.ACCESS_READ)
+
+        if not self.__load(buffer):
+            buffer.close()
+            return False
+        return True
+
+    def __load(self, buffer : mmap.mmap | bytes) -> bool:
+        self.close()
+        if len(buffer) < BOARD_PACK_HEADER.size:
+            return False
+
+        magic, version, index_length, enum_digest = BOARD_PACK_HEADER.unpack_from(buffer, 0)
+        if not magic == BOARD_PACK_MAGIC or not version == BOARD_PACK_VERSION or not enum_digest == ENUM_DIGEST:
+            return False
+
+        try:
+            index = json.loads(buffer[BOARD_PACK_HEADER.size:BOARD_PACK_HEADER.size + index_length].decode('utf8'))
+            entries = { x['path']: BoardPackEntry(x) for x in index.get('entries', ()) }
+        except (ValueError, KeyError):
+            return False
+
+        data_start = BOARD_PACK_HEADER.size + index_length
+        data_start += -data_start % BOARD_PACK_ALIGNMENT
+        for entry in entries.values():
+            if data_start + entry.offset + entry.piece_count * PIECE_RECORD.size > len(buffer):
+                return False
+
+        self.__buffer = buffer
+        self.__data_start = data_start
+        self.__entries = entries
+        return True
+
+    def __is_current(self, stamps : dict[str, tuple[int, int]]) -> bool:
+        if not len(stamps) == len(self.__entries):
+            return False
+        for (key, stamp) in stamps.items():
+            entry = self.__entries.get(key, None)
+            if entry is None or not entry.stamp == stamp:
+                return False
+        return True
+
+    def __get_stamps(self) -> dict[str, tuple[int, int]]:
+        stamps : dict[str, tuple[int, int]] = {}
+        for path in BoardLoader.get_board_paths(self.__boards_folder):
+            stat = os.stat(path.get_literal_path())
+            stamps[self.__get_key(path)] = (stat.st_mtime_ns, stat.st_size)
+        return stamps
+
+    def __get_key(self, path : PathLike) -> str:
+        literal_path = self.__boards_folder.get_relative_path(path).get_literal_path()
+        relative_path = os.path.relpath(literal_path, self.__boards_folder.get_literal_path())
+        return relative_path.replace(os.sep, '/')
+
+    def __get_path(self, key : str) -> Path:
+        return Path((self.__boards_folder.get_literal_path(), *key.split('/')))
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @property
+    def entry_count(self) -> int:
+        return len(self.__entries)
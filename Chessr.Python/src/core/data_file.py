@@ -0,0 +1,18 @@
+import os
+from typing import Optional
+
+DELIM = ':'
+
+def read_data_file(path : str) -> Optional[dict[str, str]]:
+    if not os.path.exists(path):
+        return None
+
+    data : dict[str, str] = {}
+    with open(path, 'r', encoding='utf8') as file:
+        for line in file:
+            if len(line) == 0 or line[0] == '#':
+                continue
+            args = line.split(DELIM, 1)
+            if len(args) == 2:
+                data[args[0]] = args[1].strip('\n')
+    return data
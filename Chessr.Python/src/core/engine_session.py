@@ -0,0 +1,88 @@
+from typing import Iterable, Optional, cast
+
+from backend import (ChessEngine, Consequence, ConsequenceType, Move,
+                     MoveConsequence, PieceConfiguration, Player)
+from backend import State as BackendState
+from src.core.board_data import BoardData
+from src.utils.helpers import IntVector
+
+
+class MoveIndex:
+
+    def __init__(self, moves : Iterable[Move]) -> None:
+        self.__moves = tuple(moves)
+        self.__moves_from : dict[IntVector, list[tuple[Move, frozenset[IntVector]]]] = {}
+        self.__targets : dict[IntVector, frozenset[IntVector]] = {}
+
+        for move in self.__moves:
+            sources : set[IntVector] = set()
+            targets : set[IntVector] = set()
+            for consequence in move.get_consequences():
+                if not consequence.get_type() == ConsequenceType.MOVE:
+                    continue
+                consequence = cast(MoveConsequence, consequence)
+                sources.add(tuple(consequence.from_gxy))
+                targets.add(tuple(consequence.to_gxy))
+
+            entry = (move, frozenset(targets))
+            for gxy in sources:
+                self.__moves_from.setdefault(gxy, []).append(entry)
+
+        for (gxy, entries) in self.__moves_from.items():
+            self.__targets[gxy] = frozenset().union(*(x for (_, x) in entries))
+
+    def get_moves_from(self, gxy : IntVector) -> tuple[Move, ...]:
+        return tuple(x for (x, _) in self.__moves_from.get(gxy, ()))
+
+    def get_targets(self, gxy : IntVector) -> frozenset[IntVector]:
+        return self.__targets.get(gxy, frozenset())
+
+    def get_move(self, from_gxy : IntVector, to_gxy : IntVector) -> Optional[Move]:
+        return next((x for (x, y) in self.__moves_from.get(from_gxy, ()) if to_gxy in y), None)
+
+    @property
+    def moves(self) -> tuple[Move, ...]:
+        return self.__moves
+
+class EngineSession:
+
+    def __init__(self, piece_configuration : PieceConfiguration, board_data : BoardData) -> None:
+        self.__piece_configuration = piece_configuration
+        self.__board_data = board_data
+        self.__engine = ChessEngine(piece_configuration)
+        self.__move_index : Optional[MoveIndex] = None
+
+    def start(self) -> None:
+        self.__engine.start(self.__board_data.grid, self.__board_data.starting_turn)
+        self.__move_index = None
+
+    def make_move(self, move : Move) -> list[Consequence]:
+        consequences = self.__engine.make_move(move)
+        self.__move_index = None
+        return consequences
+
+    @property
+    def move_index(self) -> MoveIndex:
+        if self.__move_index is None:
+            self.__move_index = MoveIndex(self.__engine.get_current_moves())
+        return self.__move_index
+
+    @property
+    def current_player(self) -> Player:
+        return self.__engine.get_current_player()
+
+    @property
+    def state(self) -> BackendState:
+        return self.__engine.get_state()
+
+    @property
+    def engine(self) -> ChessEngine:
+        return self.__engine
+
+    @property
+    def piece_configuration(self) -> PieceConfiguration:
+        return self.__piece_configuration
+
+    @property
+    def board_data(self) -> BoardData:
+        return self.__board_data
@@ -0,0 +1,162 @@
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import auto
+from threading import Lock
+from typing import Any, Callable, Iterable, Optional
+
+from src.engine.startup_profiler import StartupProfiler
+from src.utils.enums import ArrayEnum
+
+
+class LoadingPhase(ArrayEnum):
+    BOARDS = auto()
+    FONTS = auto()
+    SPRITESHEETS = auto()
+    STATES = auto()
+
+class LoadJob:
+
+    def __init__(
+        self,
+        phase : LoadingPhase,
+        work : Callable[[], Any],
+        main_thread : bool = False,
+        dependencies : Iterable['LoadJob'] = (),
+        name : Optional[str] = None
+    ) -> None:
+        self.__phase = phase
+        self.__name = phase.name.lower() if name is None else name
+        self.__work = work
+        self.__main_thread = main_thread
+        self.__dependencies = tuple(dependencies)
+        self.__done = False
+
+    def run(self) -> None:
+        self.__work()
+        self.__done = True
+
+    @property
+    def phase(self) -> LoadingPhase:
+        return self.__phase
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @property
+    def main_thread(self) -> bool:
+        return self.__main_thread
+
+    @property
+    def ready(self) -> bool:
+        return all(x.done for x in self.__dependencies)
+
+    @property
+    def done(self) -> bool:
+        return self.__done
+
+class AssetLoader:
+
+    def __init__(
+        self,
+        jobs : Iterable[LoadJob],
+        workers : Optional[int] = None,
+        frame_budget : float = 8
+    ) -> None:
+        jobs = tuple(jobs)
+        self.__worker_jobs = tuple(x for x in jobs if not x.main_thread)
+        self.__main_jobs = deque(x for x in jobs if x.main_thread)
+        self.__workers = min(32, (os.cpu_count() or 1) + 4) if workers is None else workers
+        self.__frame_budget = frame_budget
+        self.__futures : list[Future[None]] = []
+
+        self.__lock = Lock()
+        self.__job_count = len(jobs)
+        self.__completed = 0
+        self.__phase_jobs = [0] * len(LoadingPhase)
+        self.__phase_completed = [0] * len(LoadingPhase)
+        self.__phase_bounds : list[Optional[tuple[float, float]]] = [None] * len(LoadingPhase)
+        for job in jobs:
+            self.__phase_jobs[job.phase] += 1
+
+    def start(self) -> None:
+        if self.__workers <= 0 or len(self.__worker_jobs) == 0:
+            self.__main_jobs.extendleft(reversed(self.__worker_jobs))
+            return
+
+        executor = ThreadPoolExecutor(self.__workers, thread_name_prefix='loader')
+        self.__futures = [executor.submit(self.__run, x) for x in self.__worker_jobs]
+        executor.shutdown(wait=False)
+
+    def update(self) -> bool:
+        for future in self.__futures:
+            if future.done() and not future.exception() is None:
+                raise future.exception() # type: ignore
+
+        deadline = time.perf_counter() + self.__frame_budget / 1000
+        while len(self.__main_jobs) > 0 and self.__main_jobs[0].ready:
+            self.__run(self.__main_jobs.popleft())
+            if time.perf_counter() >= deadline:
+                break
+        return self.finished
+
+    def wait(self) -> None:
+        for future in self.__futures:
+            future.result()
+        while len(self.__main_jobs) > 0:
+            job = self.__main_jobs.popleft()
+            if not job.ready:
+                raise SystemExit('A loading job was run before its dependencies.')
+            self.__run(job)
+
+    def get_phase_progress(self, phase : LoadingPhase) -> float:
+        with self.__lock:
+            jobs = self.__phase_jobs[phase]
+            return 1 if jobs == 0 else self.__phase_completed[phase] / jobs
+
+    def get_phase_job_count(self, phase : LoadingPhase) -> int:
+        return self.__phase_jobs[phase]
+
+    def get_phase_time(self, phase : LoadingPhase) -> float:
+        with self.__lock:
+            bounds = self.__phase_bounds[phase]
+        return 0 if bounds is None else (bounds[1] - bounds[0]) * 1000
+
+    def __run(self, job : LoadJob) -> None:
+        start = time.perf_counter()
+        job.run()
+        end = time.perf_counter()
+        StartupProfiler.get().record(f'{job.phase.name.lower()}: {job.name}', start, end)
+
+        with self.__lock:
+            self.__completed += 1
+            self.__phase_completed[job.phase] += 1
+            bounds = self.__phase_bounds[job.phase]
+            if bounds is None:
+                self.__phase_bounds[job.phase] = (start, end)
+            else:
+                self.__phase_bounds[job.phase] = (min(bounds[0], start), max(bounds[1], end))
+
+    @property
+    def progress(self) -> float:
+        with self.__lock:
+            return 1 if self.__job_count == 0 else self.__completed / self.__job_count
+
+    @property
+    def phase(self) -> Optional[LoadingPhase]:
+        with self.__lock:
+            for phase in LoadingPhase:
+                if self.__phase_completed[phase] < self.__phase_jobs[phase]:
+                    return phase
+        return None
+
+    @property
+    def finished(self) -> bool:
+        with self.__lock:
+            return self.__completed == self.__job_count
+
+    @property
+    def workers(self) -> int:
+        return self.__workers
@@ -0,0 +1,168 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+from typing import Any, Optional
+
+import pygame as pg
+
+from src.utils.path import Path, PathLike
+
+PACK_MAGIC = b'CHSRPACK'
+PACK_VERSION = 1
+PACK_HEADER = struct.Struct('<8sII')
+PACK_ALIGNMENT = 16
+
+PACKED_IMAGES : dict[str, tuple[float, ...]] = {
+    'board.png': (1, 3.75),
+    'highlights.png': (1, 3.75),
+    'icon.png': (1,),
+    'pieces.png': (1, 3),
+    'shadows.png': (1, 3),
+    'spinner.png': (1,)
+}
+
+class AssetPack():
+
+    def __init__(
+        self,
+        pathlike : PathLike = ('cache', 'assets.pack'),
+        images : Optional[dict[str, tuple[float, ...]]] = None
+    ) -> None:
+        self.__path = Path(pathlike).get_literal_path()
+        self.__images = PACKED_IMAGES if images is None else images
+        self.__buffer : Optional[mmap.mmap] = None
+        self.__entries : dict[tuple[str, float], tuple[int, int, int]] = {}
+
+    def sync(self) -> bool:
+        hashes = self.__hash_sources()
+        if self.__open(hashes):
+            return False
+
+        self.build(hashes)
+        if not self.__open(hashes):
+            raise SystemExit(f'The asset pack \'{self.__path}\' could not be read after building it.')
+        return True
+
+    def open(self) -> bool:
+        return self.__open(self.__hash_sources())
+
+    def build(self, hashes : Optional[dict[str, str]] = None) -> None:
+        self.close()
+        hashes = self.__hash_sources() if hashes is None else hashes
+
+        entries : list[dict[str, Any]] = []
+        buffers : list[bytes] = []
+        offset = 0
+        for name, scales in sorted(self.__images.items()):
+            source = pg.image.load(self.__get_source_path(name)).convert_alpha()
+            w, h = source.get_size()
+            for scale in scales:
+                image = source if scale == 1 else pg.transform.scale(source, (int(w * scale), int(h * scale)))
+                data = pg.image.tobytes(image, 'RGBA')
+                entries.append({
+                    'name': name,
+                    'scale': scale,
+                    'width': image.get_width(),
+                    'height': image.get_height(),
+                    'offset': offset,
+                    'length': len(data)
+                })
+                buffers.append(data)
+                offset += len(data)
+
+        index = json.dumps({ 'sources': hashes, 'entries': entries }).encode('utf8')
+        header = PACK_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(index)) + index
+        header += bytes(-len(header) % PACK_ALIGNMENT)
+
+        os.makedirs(os.path.dirname(self.__path), exist_ok = True)
+        temporary_path = self.__path + '.tmp'
+        with open(temporary_path, 'wb') as file:
+            file.write(header)
+            for data in buffers:
+                file.write(data)
+        os.replace(temporary_path, self.__path)
+
+    def close(self) -> None:
+        if not self.__buffer is None:
+            self.__buffer.close()
+            self.__buffer = None
+        self.__entries = {}
+
+    def get_image(
+        self,
+        pathlike : PathLike,
+        scale : float = 1,
+        use_alpha : bool = False
+    ) -> Optional[pg.surface.Surface]:
+        entry = self.__entries.get((self.__get_name(pathlike), scale), None)
+        if entry is None or self.__buffer is None:
+            return None
+
+        offset, w, h = entry
+        surface = pg.image.frombuffer(memoryview(self.__buffer)[offset:offset + w * h * 4], (w, h), 'RGBA')
+        return surface.convert_alpha() if use_alpha else surface.convert()
+
+    def has_image(self, pathlike : PathLike, scale : float = 1) -> bool:
+        return (self.__get_name(pathlike), scale) in self.__entries
+
+    def __open(self, hashes : dict[str, str]) -> bool:
+        self.close()
+        if not os.path.isfile(self.__path) or os.path.getsize(self.__path) < PACK_HEADER.size:
+            return False
+
+        with open(self.__path, 'rb') as file:
+            buffer = mmap.mmap(file.fileno(), 0, access = mmap.ACCESS_READ)
+
+        magic, version, index_length = PACK_HEADER.unpack_from(buffer, 0)
+        if not magic == PACK_MAGIC or not version == PACK_VERSION:
+            buffer.close()
+            return False
+
+        try:
+            index = json.loads(buffer[PACK_HEADER.size:PACK_HEADER.size + index_length].decode('utf8'))
+        except ValueError:
+            buffer.close()
+            return False
+        if not index.get('sources', None) == hashes:
+            buffer.close()
+            return False
+
+        data_start = PACK_HEADER.size + index_length
+        data_start += -data_start % PACK_ALIGNMENT
+        entries : dict[tuple[str, float], tuple[int, int, int]] = {}
+        for entry in index.get('entries', ()):
+            offset = data_start + entry['offset']
+            if offset + entry['length'] > len(buffer):
+                buffer.close()
+                return False
+            entries[(entry['name'], entry['scale'])] = (offset, entry['width'], entry['height'])
+
+        self.__buffer = buffer
+        self.__entries = entries
+        return True
+
+    def __hash_sources(self) -> dict[str, str]:
+        hashes : dict[str, str] = {}
+        for name, scales in sorted(self.__images.items()):
+            digest = hashlib.sha256()
+            with open(self.__get_source_path(name), 'rb') as file:
+                digest.update(file.read())
+            digest.update(json.dumps(scales).encode('utf8'))
+            hashes[name] = digest.hexdigest()
+        return hashes
+
+    def __get_source_path(self, name : str) -> str:
+        return Path('images').get_relative_path(tuple(name.split('/'))).get_literal_path()
+
+    def __get_name(self, pathlike : PathLike) -> str:
+        return '/'.join(Path(pathlike).get_segments())
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @property
+    def entry_count(self) -> int:
+        return len(self.__entries)
@@ -1,14 +1,21 @@
-from typing import Optional
+from typing import Callable, Optional, TypeVar
 
 from src.engine.camera import Camera
 from src.engine.file_manager import FileManager
+from src.engine.frame_profiler import FrameProfiler
+from src.engine.frame_scheduler import FrameScheduler
+from src.engine.glyph_renderer import GlyphRenderer
 from src.engine.group_manager import GroupManager
 from src.engine.spritesheets.board_spritesheet import BoardSpritesheet
 from src.engine.spritesheets.highlight_spritesheet import HighlightSpritesheet
 from src.engine.spritesheets.piece_spritesheet import PieceSpritesheet
 from src.engine.spritesheets.shadow_spritesheet import ShadowSpritesheet
 from src.engine.spritesheets.spinner_spritesheet import SpinnerSpritesheet
+from src.engine.startup_profiler import StartupProfiler
+from src.engine.surface_cache import SurfaceCache
+from src.engine.text_cache import TextCache
 
+T = TypeVar('T')
 
 class Factory:
 
@@ -26,7 +33,13 @@ class Factory:
 
         self.__camera : Optional[Camera] = None
         self.__file_manager : Optional[FileManager] = None
+        self.__frame_profiler : Optional[FrameProfiler] = None
+        self.__frame_scheduler : Optional[FrameScheduler] = None
         self.__group_manager : Optional[GroupManager] = None
+        self.__sheet_cache : Optional[SurfaceCache] = None
+        self.__chrome_cache : Optional[SurfaceCache] = None
+        self.__text_cache : Optional[TextCache] = None
+        self.__glyph_renderer : Optional[GlyphRenderer] = None
         self.__board_spritesheet : Optional[BoardSpritesheet] = None
         self.__highlight_spritesheet : Optional[HighlightSpritesheet] = None
         self.__piece_spritesheet : Optional[PieceSpritesheet] = None
@@ -36,47 +49,97 @@ class Factory:
     @property
     def camera(self) -> Camera:
         if self.__camera is None:
-            self.__camera = Camera()
+            self.__camera = self.__create('camera', Camera)
         return self.__camera
 
     @property
     def file_manager(self) -> FileManager:
         if self.__file_manager is None:
-            self.__file_manager = FileManager()
+            self.__file_manager = self.__create('file_manager', FileManager)
         return self.__file_manager
 
+    @property
+    def frame_profiler(self) -> FrameProfiler:
+        if self.__frame_profiler is None:
+            self.__frame_profiler = self.__create('frame_profiler', FrameProfiler)
+        return self.__frame_profiler
+
+    @property
+    def frame_scheduler(self) -> FrameScheduler:
+        if self.__frame_scheduler is None:
+            self.__frame_scheduler = self.__create('frame_scheduler', FrameScheduler)
+        return self.__frame_scheduler
+
     @property
     def group_manager(self) -> GroupManager:
         if self.__group_manager is None:
-            self.__group_manager = GroupManager()
+            self.__group_manager = self.__create('group_manager', GroupManager)
         return self.__group_manager
 
+    @property
+    def sheet_cache(self) -> SurfaceCache:
+        if self.__sheet_cache is None:
+            self.__sheet_cache = self.__create('sheet_cache', SurfaceCache)
+        return self.__sheet_cache
+
+    @property
+    def chrome_cache(self) -> SurfaceCache:
+        if self.__chrome_cache is None:
+            self.__chrome_cache = self.__create('chrome_cache', lambda : SurfaceCache(4 * 1024 * 1024))
+        return self.__chrome_cache
+
+    @property
+    def text_cache(self) -> TextCache:
+        if self.__text_cache is None:
+            self.__text_cache = self.__create('text_cache', lambda : TextCache(self.file_manager))
+        return self.__text_cache
+
+    @property
+    def glyph_renderer(self) -> GlyphRenderer:
+        if self.__glyph_renderer is None:
+            self.__glyph_renderer = self.__create('glyph_renderer', lambda : GlyphRenderer(self.file_manager))
+        return self.__glyph_renderer
+
     @property
     def board_spritesheet(self) -> BoardSpritesheet:
         if self.__board_spritesheet is None:
-            self.__board_spritesheet = BoardSpritesheet(self.file_manager)
+            self.__board_spritesheet = self.__create(
+                'board_spritesheet',
+                lambda : BoardSpritesheet(self.file_manager, self.sheet_cache))
         return self.__board_spritesheet
     
     @property
     def highlight_spritesheet(self) -> HighlightSpritesheet:
         if self.__highlight_spritesheet is None:
-            self.__highlight_spritesheet = HighlightSpritesheet(self.file_manager)
+            self.__highlight_spritesheet = self.__create(
+                'highlight_spritesheet',
+                lambda : HighlightSpritesheet(self.file_manager, self.sheet_cache))
         return self.__highlight_spritesheet
     
     @property
     def piece_spritesheet(self) -> PieceSpritesheet:
         if self.__piece_spritesheet is None:
-            self.__piece_spritesheet = PieceSpritesheet(self.file_manager)
+            self.__piece_spritesheet = self.__create(
+                'piece_spritesheet',
+                lambda : PieceSpritesheet(self.file_manager, self.sheet_cache))
         return self.__piece_spritesheet
     
     @property
     def shadow_spritesheet(self) -> ShadowSpritesheet:
         if self.__shadow_spritesheet is None:
-            self.__shadow_spritesheet = ShadowSpritesheet(self.file_manager)
+            self.__shadow_spritesheet = self.__create(
+                'shadow_spritesheet',
+                lambda : ShadowSpritesheet(self.file_manager, self.sheet_cache))
         return self.__shadow_spritesheet
 
     @property
     def spinner_spritesheet(self) -> SpinnerSpritesheet:
         if self.__spinner_spritesheet is None:
-            self.__spinner_spritesheet = SpinnerSpritesheet(self.file_manager)
+            self.__spinner_spritesheet = self.__create(
+                'spinner_spritesheet',
+                lambda : SpinnerSpritesheet(self.file_manager, self.sheet_cache))
         return self.__spinner_spritesheet
+
+    def __create(self, name : str, create : Callable[[], T]) -> T:
+        with StartupProfiler.get().measure(f'Factory.{name}'):
+            return create()
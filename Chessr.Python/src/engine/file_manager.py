@@ -1,18 +1,27 @@
 import os
+from threading import Lock
 from typing import Optional
 
 import pygame as pg
 
+from src.core.board_loader import BoardLoader
+from src.core.data_file import DELIM as DATA_FILE_DELIM
+from src.core.data_file import read_data_file
+from src.engine.asset_pack import AssetPack
 from src.utils.path import Path, PathLike
 
 
 class FileManager():
 
-    DELIM = ':'
+    DELIM = DATA_FILE_DELIM
     DEFAULT_FONT = 'Roboto-Black.ttf'
 
     def __init__(self) -> None:
         self.__fonts : dict[str, dict[int, pg.font.Font]]= {}
+        self.__font_lock = Lock()
+        self.__asset_pack : Optional[AssetPack] = None
+        self.__decoded_images : dict[tuple[str, ...], pg.surface.Surface] = {}
+        self.__decoded_lock = Lock()
         if not pg.image.get_extended():
             raise SystemExit('The extended image types are required.')
 
@@ -20,36 +29,61 @@ class FileManager():
         return self.load_font(FileManager.DEFAULT_FONT, pt)
 
     def load_font(self, name : str, pt : int) -> pg.font.Font:
-        if not name in self.__fonts:
-            self.__fonts[name] = {}
+        with self.__font_lock:
+            if not name in self.__fonts:
+                self.__fonts[name] = {}
 
-        if not pt in self.__fonts[name]:
-            path = Path(('files', 'fonts')).get_relative_path(name).get_literal_path()
-            self.__fonts[name][pt] = pg.font.Font(path, pt)
-            
-        return self.__fonts[name][pt]
+            if not pt in self.__fonts[name]:
+                path = Path(('files', 'fonts')).get_relative_path(name).get_literal_path()
+                self.__fonts[name][pt] = pg.font.Font(path, pt)
+                
+            return self.__fonts[name][pt]
 
     def load_image(
         self,
         pathlike : PathLike,
         use_alpha : bool = False
     ) -> pg.surface.Surface:
-        path = Path('images').get_relative_path(pathlike).get_literal_path()
-        try:
-            surface = pg.image.load(path)
-        except pg.error as e:
-            raise SystemExit(f'The image \'{path}\' could not be loaded.') from e
+        with self.__decoded_lock:
+            surface = self.__decoded_images.pop(Path(pathlike).get_segments(), None)
+
+        if surface is None:
+            packed = self.load_packed_image(pathlike, 1, use_alpha)
+            if not packed is None:
+                return packed
+            surface = self.__decode_image(pathlike)
         return surface.convert_alpha() if use_alpha else surface.convert()
 
-    def load_board(
+    def decode_image(self, pathlike : PathLike) -> None:
+        if not self.__asset_pack is None and self.__asset_pack.has_image(pathlike):
+            return
+        surface = self.__decode_image(pathlike)
+        with self.__decoded_lock:
+            self.__decoded_images[Path(pathlike).get_segments()] = surface
+
+    def load_packed_image(
         self,
-        pathlike : PathLike
-    ) -> Optional[dict[str, str]]:
-        path_object = self.__get_path_object(pathlike)
-        return self.load_file(self.__get_boards_folder().get_relative_path(path_object))
+        pathlike : PathLike,
+        scale : float,
+        use_alpha : bool = False
+    ) -> Optional[pg.surface.Surface]:
+        if self.__asset_pack is None:
+            return None
+        return self.__asset_pack.get_image(pathlike, scale, use_alpha)
+
+    def load_asset_pack(self, asset_pack : Optional[AssetPack] = None) -> bool:
+        if not self.__asset_pack is None:
+            self.__asset_pack.close()
+        self.__asset_pack = AssetPack() if asset_pack is None else asset_pack
+        try:
+            return self.__asset_pack.sync()
+        except OSError:
+            self.__asset_pack.close()
+            self.__asset_pack = None
+            return False
 
-    def get_board_paths(self):
-        return self.get_files_in_folder(self.__get_boards_folder(), True)
+    def get_board_paths(self) -> tuple[Path, ...]:
+        return BoardLoader.get_board_paths()
 
     def load_file(
         self,
@@ -58,21 +92,12 @@ class FileManager():
     ) -> Optional[dict[str, str]]:
         path_object = self.__get_path_object(pathlike)
 
-        path = path_object.get_literal_path()
-        if not self.__exists(path):
+        data = read_data_file(path_object.get_literal_path())
+        if data is None:
             if not default is None:
                 self.overwrite_file(path_object, default)
             return default
         
-        data : dict[str, str] = {}
-        with open(path, 'r', encoding='utf8') as file:
-            for line in file:
-                if len(line) == 0 or line[0] == '#':
-                    continue
-                args = line.split(FileManager.DELIM, 1)
-                if len(args) == 2:
-                    data[args[0]] = args[1].strip('\n')
-        
         rewrite = False
         if not default is None:
             for k in default.keys():
@@ -97,16 +122,12 @@ class FileManager():
             for (x, y) in content.items():
                 file.write(str(x) + FileManager.DELIM + str(y) + '\n')
 
-    def get_files_in_folder(self, pathlike : PathLike, recursive : bool) -> tuple[Path, ...]:
-        path = self.__get_path_object(pathlike).get_literal_path()
-        paths : list[Path] = []
-        for name in os.listdir(path):
-            path_object = self.__get_path_object((path, name))
-            if os.path.isfile(path_object.get_literal_path()):
-                paths.append(path_object)
-            elif recursive:
-                paths.extend(self.get_files_in_folder(path_object.get_literal_path(), True))
-        return tuple(paths)
+    def __decode_image(self, pathlike : PathLike) -> pg.surface.Surface:
+        path = Path('images').get_relative_path(pathlike).get_literal_path()
+        try:
+            return pg.image.load(path)
+        except pg.error as e:
+            raise SystemExit(f'The image \'{path}\' could not be loaded.') from e
 
     def __get_path_object(self, obj : PathLike) -> Path:
         if isinstance(obj, Path):
@@ -118,6 +139,3 @@ class FileManager():
 
     def __exists(self, path : str) -> bool:
         return os.path.exists(path)
-    
-    def __get_boards_folder(self) -> Path:
-        return Path(('files', 'boards'))
@@ -0,0 +1,148 @@
+import csv
+import os
+import time
+from collections import deque
+from datetime import datetime
+from enum import auto
+from typing import Optional
+
+from src.engine.group_manager import GroupType
+from src.utils.enums import ArrayEnum
+from src.utils.path import Path, PathLike
+
+
+class ProfilerPhase(ArrayEnum):
+    EVENTS = auto()
+    TWEENS = auto()
+    STATE_UPDATE = auto()
+    GROUP_UPDATE = auto()
+    DRAW = auto()
+    FLIP = auto()
+
+class FrameRecord:
+
+    def __init__(
+        self,
+        index : int,
+        timestamp : float,
+        phase_times : tuple[float, ...],
+        sprite_counts : dict[GroupType, int],
+        backend_times : tuple[float, ...]
+    ) -> None:
+        self.__index = index
+        self.__timestamp = timestamp
+        self.__phase_times = phase_times
+        self.__sprite_counts = sprite_counts
+        self.__backend_times = backend_times
+
+    def get_phase_time(self, phase : ProfilerPhase) -> float:
+        return self.__phase_times[phase]
+
+    @property
+    def index(self) -> int:
+        return self.__index
+
+    @property
+    def timestamp(self) -> float:
+        return self.__timestamp
+
+    @property
+    def total_time(self) -> float:
+        return sum(self.__phase_times)
+
+    @property
+    def sprite_counts(self) -> dict[GroupType, int]:
+        return self.__sprite_counts
+
+    @property
+    def backend_times(self) -> tuple[float, ...]:
+        return self.__backend_times
+
+class FrameProfiler:
+
+    def __init__(self, capacity : int = 600) -> None:
+        self.__frames : deque[FrameRecord] = deque(maxlen=capacity)
+        self.__frame_index = 0
+        self.__phase_times = [0.0] * len(ProfilerPhase)
+        self.__backend_times : deque[float] = deque()
+        self.__last_backend_time : Optional[float] = None
+
+    def start(self) -> float:
+        return time.perf_counter()
+
+    def record(self, phase : ProfilerPhase, start : float) -> None:
+        self.__phase_times[phase] += (time.perf_counter() - start) * 1000
+
+    def record_backend_call(self, duration : float) -> None:
+        self.__backend_times.append(duration)
+        self.__last_backend_time = duration
+
+    def end_frame(self, sprite_counts : dict[GroupType, int]) -> None:
+        backend_times : list[float] = []
+        while len(self.__backend_times) > 0:
+            backend_times.append(self.__backend_times.popleft())
+
+        self.__frames.append(FrameRecord(
+            self.__frame_index,
+            time.perf_counter() * 1000,
+            tuple(self.__phase_times),
+            sprite_counts,
+            tuple(backend_times)))
+
+        self.__frame_index += 1
+        self.__phase_times = [0.0] * len(ProfilerPhase)
+
+    def get_phase_average(self, phase : ProfilerPhase, frames : int = 60) -> float:
+        records = self.__get_recent(frames)
+        if len(records) == 0:
+            return 0
+        return sum(x.get_phase_time(phase) for x in records) / len(records)
+
+    def get_phase_max(self, phase : ProfilerPhase, frames : int = 60) -> float:
+        return max((x.get_phase_time(phase) for x in self.__get_recent(frames)), default=0)
+
+    def get_fps(self, frames : int = 60) -> float:
+        records = self.__get_recent(frames)
+        if len(records) < 2:
+            return 0
+        elapsed = records[-1].timestamp - records[0].timestamp
+        return 0 if elapsed <= 0 else (len(records) - 1) * 1000 / elapsed
+
+    def export_csv(self, pathlike : Optional[PathLike] = None) -> str:
+        if pathlike is None:
+            stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            pathlike = ('profiles', f'frame_profile_{stamp}.csv')
+        path = pathlike.get_literal_path() if isinstance(pathlike, Path) else Path(pathlike).get_literal_path()
+        os.makedirs(os.path.dirname(path), exist_ok = True)
+
+        group_types = sorted(GroupType)
+        with open(path, 'w', newline='', encoding='utf8') as file:
+            writer = csv.writer(file)
+            writer.writerow((
+                'frame',
+                'timestamp_ms',
+                *(f'{x.name.lower()}_ms' for x in sorted(ProfilerPhase)),
+                'total_ms',
+                'backend_ms',
+                *(f'{x.name.lower()}_sprites' for x in group_types)))
+            for record in tuple(self.__frames):
+                writer.writerow((
+                    record.index,
+                    f'{record.timestamp:.3f}',
+                    *(f'{record.get_phase_time(x):.3f}' for x in sorted(ProfilerPhase)),
+                    f'{record.total_time:.3f}',
+                    ' '.join(f'{x:.3f}' for x in record.backend_times),
+                    *(record.sprite_counts.get(x, '') for x in group_types)))
+        return path
+
+    def __get_recent(self, frames : int) -> list[FrameRecord]:
+        count = min(frames, len(self.__frames))
+        return [self.__frames[i] for i in range(len(self.__frames) - count, len(self.__frames))]
+
+    @property
+    def last_frame(self) -> Optional[FrameRecord]:
+        return self.__frames[-1] if len(self.__frames) > 0 else None
+
+    @property
+    def last_backend_time(self) -> Optional[float]:
+        return self.__last_backend_time
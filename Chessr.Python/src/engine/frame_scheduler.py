@@ -0,0 +1,55 @@
+import pygame as pg
+
+HIDDEN_EVENTS = (pg.WINDOWMINIMIZED, pg.WINDOWHIDDEN)
+SHOWN_EVENTS = (pg.WINDOWRESTORED, pg.WINDOWSHOWN, pg.WINDOWEXPOSED, pg.WINDOWMAXIMIZED)
+
+class FrameScheduler:
+
+    def __init__(self, fps : int = 60, idle_timeout : int = 500) -> None:
+        self.__fps = fps
+        self.__idle_timeout = idle_timeout
+        self.__clock = pg.time.Clock()
+        self.__wake_event = pg.event.custom_type()
+
+        self.__active = True
+        self.__window_visible = True
+
+    def wake(self) -> None:
+        self.__active = True
+        if pg.display.get_init():
+            pg.event.post(pg.event.Event(self.__wake_event))
+
+    def get_events(self) -> list[pg.event.Event]:
+        if self.__active and self.__window_visible:
+            events = pg.event.get()
+        else:
+            event = pg.event.wait(self.__idle_timeout)
+            events = [] if event.type == pg.NOEVENT else [event, *pg.event.get()]
+
+        if len(events) > 0:
+            self.__active = True
+
+        for event in events:
+            if event.type in HIDDEN_EVENTS:
+                self.__window_visible = False
+            elif event.type in SHOWN_EVENTS:
+                self.__window_visible = True
+
+        return [x for x in events if not x.type == self.__wake_event]
+
+    def should_render(self) -> bool:
+        return self.__active and self.__window_visible
+
+    def end_frame(self, active : bool) -> None:
+        rendered = self.should_render()
+        self.__active = active
+        if rendered:
+            self.__clock.tick(self.__fps)
+
+    @property
+    def active(self) -> bool:
+        return self.__active
+
+    @property
+    def window_visible(self) -> bool:
+        return self.__window_visible
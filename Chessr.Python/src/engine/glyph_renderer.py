@@ -0,0 +1,110 @@
+from threading import Lock
+
+import pygame as pg
+
+from src.engine.file_manager import FileManager
+from src.utils.helpers import Colour
+
+
+class GlyphAtlas():
+
+    ATLAS_WIDTH = 512
+
+    def __init__(self, font : pg.font.Font, colour : Colour, antialias : bool) -> None:
+        self.__font = font
+        self.__colour = colour
+        self.__antialias = antialias
+        self.__line_height = font.get_height()
+
+        self.__atlas = pg.Surface((GlyphAtlas.ATLAS_WIDTH, self.__line_height), pg.SRCALPHA, 32)
+        self.__cursor = (0, 0)
+        self.__glyphs : dict[str, tuple[pg.Rect, int]] = {}
+        self.__kerning : dict[tuple[str, str], int] = {}
+
+    def render(self, text : str) -> pg.surface.Surface:
+        glyphs = [self.__get_glyph(c) for c in text]
+
+        positions : list[int] = []
+        x = width = 0
+        for (i, (rect, advance)) in enumerate(glyphs):
+            if i > 0:
+                x += self.__get_kerning(text[i - 1], text[i])
+            positions.append(x)
+            width = max(width, x + rect.w)
+            x += advance
+
+        surface = pg.Surface((width, self.__line_height), pg.SRCALPHA, 32)
+        for ((rect, _), x) in zip(glyphs, positions):
+            surface.blit(self.__atlas, (x, 0), rect, pg.BLEND_RGBA_MAX)
+        return surface
+
+    def __get_glyph(self, c : str) -> tuple[pg.Rect, int]:
+        glyph = self.__glyphs.get(c, None)
+        if not glyph is None:
+            return glyph
+
+        image = self.__font.render(c, self.__antialias, self.__colour)
+        w, h = image.get_size()
+        x, y = self.__cursor
+        if x + w > self.__atlas.get_width():
+            x, y = 0, y + self.__line_height
+        if y + h > self.__atlas.get_height():
+            self.__grow(y + h)
+
+        if self.__antialias:
+            self.__atlas.blit(image, (x, y), special_flags=pg.BLEND_RGBA_MAX)
+        else:
+            self.__atlas.blit(image, (x, y))
+
+        metrics = self.__font.metrics(c)[0]
+        advance = w if metrics is None else metrics[4]
+        glyph = (pg.Rect(x, y, w, h), advance)
+        self.__glyphs[c] = glyph
+        self.__cursor = (x + w, y)
+        return glyph
+
+    def __get_kerning(self, a : str, b : str) -> int:
+        key = (a, b)
+        kerning = self.__kerning.get(key, None)
+        if kerning is None:
+            font = self.__font
+            kerning = font.size(a + b)[0] - font.size(b)[0] - self.__get_glyph(a)[1]
+            self.__kerning[key] = kerning
+        return kerning
+
+    def __grow(self, height : int) -> None:
+        w, h = self.__atlas.get_size()
+        atlas = pg.Surface((w, max(height, 2 * h)), pg.SRCALPHA, 32)
+        atlas.blit(self.__atlas, (0, 0), special_flags=pg.BLEND_RGBA_MAX)
+        self.__atlas = atlas
+
+    @property
+    def glyph_count(self) -> int:
+        return len(self.__glyphs)
+
+class GlyphRenderer():
+
+    def __init__(self, file_manager : FileManager) -> None:
+        self.__file_manager = file_manager
+        self.__atlases : dict[tuple[str, int, Colour, bool], GlyphAtlas] = {}
+        self.__lock = Lock()
+
+    def render(
+        self,
+        font_name : str,
+        size : int,
+        text : str,
+        colour : Colour,
+        antialias : bool = True
+    ) -> pg.surface.Surface:
+        key = (font_name, size, colour, antialias)
+        with self.__lock:
+            atlas = self.__atlases.get(key, None)
+            if atlas is None:
+                atlas = GlyphAtlas(self.__file_manager.load_font(font_name, size), colour, antialias)
+                self.__atlases[key] = atlas
+            return atlas.render(text)
+
+    @property
+    def atlas_count(self) -> int:
+        return len(self.__atlases)
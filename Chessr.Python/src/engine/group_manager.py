@@ -1,10 +1,16 @@
+from bisect import bisect_left, bisect_right
 from enum import auto
-from typing import Optional, cast
+from threading import Lock
+from typing import TYPE_CHECKING, Callable, Optional, cast
 
 import pygame as pg
 
 from src.engine.state_type import StateType
 from src.utils.enums import ArrayEnum, enum_as_list
+from src.utils.helpers import Colour
+
+if TYPE_CHECKING:
+    from src.sprites.sprite import ChessrSprite
 
 
 class GroupType(ArrayEnum):
@@ -17,12 +23,67 @@ class GroupType(ArrayEnum):
     GAME_BOARD = auto()
     GAME_PIECE = auto()
     GAME_UI = auto()
+
+    DEBUG = auto()
     
 class DrawingPriority(ArrayEnum):
     MINUS_ONE = auto()
     NORMAL = auto()
     PLUS_ONE = auto()
 
+class RenderMode(ArrayEnum):
+    FULL = auto()
+    DIRTY = auto()
+
+class RenderQueue(pg.sprite.AbstractGroup):
+
+    def __init__(self, on_change : Callable[[], None]) -> None:
+        super().__init__()
+        self.__on_change = on_change
+        self.__sequence = 0
+        self.__keys : list[tuple[int, int, int]] = []
+        self.__ordered : list['ChessrSprite'] = []
+        self.__sprite_keys : dict['ChessrSprite', tuple[int, int, int]] = {}
+
+    def add_internal(self, sprite : 'ChessrSprite', layer : Optional[int] = None) -> None:
+        super().add_internal(sprite)
+        self.__insert(sprite, sprite.layer if layer is None else layer)
+
+    def remove_internal(self, sprite : 'ChessrSprite') -> None:
+        super().remove_internal(sprite)
+        self.__remove(sprite)
+
+    def change_layer(self, sprite : 'ChessrSprite', layer : int) -> None:
+        if not self.__remove(sprite):
+            return
+        self.__insert(sprite, layer)
+
+    def __insert(self, sprite : 'ChessrSprite', layer : int) -> None:
+        sprite._layer = layer # type: ignore # pylint: disable=protected-access
+        priority = DrawingPriority.NORMAL if sprite.drawing_priority is None else sprite.drawing_priority
+        key = (int(priority), layer, self.__sequence)
+        self.__sequence += 1
+
+        index = bisect_right(self.__keys, key)
+        self.__keys.insert(index, key)
+        self.__ordered.insert(index, sprite)
+        self.__sprite_keys[sprite] = key
+        self.__on_change()
+
+    def __remove(self, sprite : 'ChessrSprite') -> bool:
+        key = self.__sprite_keys.pop(sprite, None)
+        if key is None:
+            return False
+        index = bisect_left(self.__keys, key)
+        del self.__keys[index]
+        del self.__ordered[index]
+        self.__on_change()
+        return True
+
+    @property
+    def ordered(self) -> list['ChessrSprite']:
+        return self.__ordered
+
 class GroupManager():
 
     def __init__(self) -> None:
@@ -30,52 +91,175 @@ class GroupManager():
         all_group_types.sort()
         self.__all_group_types = tuple(all_group_types)
 
-        priorities = list(map(lambda x : cast(DrawingPriority, x), enum_as_list(DrawingPriority)))
-        priorities.sort()
-        self.__priorities = tuple(priorities)
-
         self.__group_types = {
             StateType.LOADING: (
                 GroupType.LOADING,
+                GroupType.DEBUG
             ),
             StateType.MAIN_MENU: (
                 GroupType.MAIN_MENU_UI,
+                GroupType.DEBUG
             ),
             StateType.BOARD_SELECTION: (
                 GroupType.BOARD_SELECTION_UI,
+                GroupType.DEBUG
             ),
             StateType.GAME: (
                 GroupType.GAME_BOARD,
                 GroupType.GAME_PIECE,
-                GroupType.GAME_UI
+                GroupType.GAME_UI,
+                GroupType.DEBUG
             )
         }
-        self.__groups : dict[GroupType, dict[DrawingPriority, pg.sprite.LayeredDirty]] = {}
+        self.__drawing_orders : dict[StateType, list['ChessrSprite']] = {}
+        self.__queues : dict[GroupType, RenderQueue] = {}
         for t in self.__all_group_types:
-            self.__groups[t] = {}
-            for p in self.__priorities:
-                self.__groups[t][p] = pg.sprite.LayeredDirty()
+            self.__queues[t] = RenderQueue(lambda t=t : self.__invalidate_drawing_orders(t))
+
+        self.__active_sprites : dict['ChessrSprite', None] = {}
+        self.__active_lock = Lock()
+
+        self.__drawn_rects : dict[pg.sprite.DirtySprite, pg.Rect] = {}
+        self.__drawn_state : Optional[StateType] = None
+        self.__full_redraw = True
 
     def update_groups(self, state_type : StateType) -> None:
-        for t in self.__group_types[state_type]:
-            for p in self.__priorities:
-                self.__groups[t][p].update()
+        group_types = self.__group_types[state_type]
+        with self.__active_lock:
+            active_sprites, self.__active_sprites = self.__active_sprites, {}
 
-    def draw_groups(self, screen : pg.surface.Surface, state_type : StateType) -> None:
-        for t in self.__group_types[state_type]:
-            for p in self.__priorities:
-                self.__groups[t][p].draw(screen)
+        still_active : list['ChessrSprite'] = []
+        for sprite in active_sprites:
+            if not sprite.alive():
+                continue
+            if not sprite.group in group_types:
+                still_active.append(sprite)
+                continue
+            sprite.update()
+            if sprite.is_animating():
+                still_active.append(sprite)
+
+        with self.__active_lock:
+            self.__active_sprites.update(dict.fromkeys(still_active))
 
-    def get_group(
+    def activate(self, sprite : 'ChessrSprite') -> None:
+        with self.__active_lock:
+            self.__active_sprites[sprite] = None
+
+    def draw_groups(
         self,
-        group : GroupType,
-        drawing_priority : Optional[DrawingPriority]
-    ) -> pg.sprite.LayeredDirty:
-        drawing_priority = DrawingPriority.NORMAL if drawing_priority is None else drawing_priority
-        return self.__groups[group][drawing_priority]
-    
-    def get_groups(
+        screen : pg.surface.Surface,
+        background : Colour,
+        state_type : StateType,
+        render_mode : RenderMode = RenderMode.DIRTY
+    ) -> list[pg.Rect]:
+        sprites = self.__get_drawing_order(state_type)
+
+        if render_mode is RenderMode.FULL \
+            or self.__full_redraw \
+            or not state_type == self.__drawn_state:
+            return self.__draw_full(screen, background, state_type, sprites)
+
+        dirty_rects : list[pg.Rect] = []
+        drawn_rects : dict[pg.sprite.DirtySprite, pg.Rect] = {}
+        for sprite in sprites:
+            previous_rect = self.__drawn_rects.pop(sprite, None)
+            if not sprite.dirty:
+                if not previous_rect is None:
+                    drawn_rects[sprite] = previous_rect
+                continue
+
+            if not previous_rect is None:
+                dirty_rects.append(previous_rect)
+            if self.__is_drawable(sprite):
+                rect = sprite.rect.copy()
+                dirty_rects.append(rect)
+                drawn_rects[sprite] = rect
+            if sprite.dirty == 1:
+                sprite.dirty = 0
+
+        dirty_rects.extend(self.__drawn_rects.values())
+        self.__drawn_rects = drawn_rects
+
+        update_rects = self.__merge_rects(dirty_rects, screen.get_rect())
+        for rect in update_rects:
+            screen.set_clip(rect)
+            screen.fill(background, rect)
+            for sprite in sprites:
+                if self.__is_drawable(sprite) and rect.colliderect(sprite.rect):
+                    self.__draw_sprite(screen, sprite)
+        screen.set_clip(None)
+
+        return update_rects
+
+    def get_sprite_counts(self, state_type : StateType) -> dict[GroupType, int]:
+        counts : dict[GroupType, int] = {}
+        for t in self.__group_types[state_type]:
+            counts[t] = len(self.__queues[t])
+        return counts
+
+    def get_active_count(self) -> int:
+        return len(self.__active_sprites)
+
+    def invalidate(self) -> None:
+        self.__full_redraw = True
+
+    def get_group(self, group : GroupType) -> RenderQueue:
+        return self.__queues[group]
+
+#region Private Methods
+
+    def __draw_full(
         self,
-        group : GroupType
-    ) -> tuple[pg.sprite.LayeredDirty, ...]:
-        return tuple(self.__groups[group].values())
+        screen : pg.surface.Surface,
+        background : Colour,
+        state_type : StateType,
+        sprites : list['ChessrSprite']
+    ) -> list[pg.Rect]:
+        screen.fill(background)
+        self.__drawn_rects = {}
+        for sprite in sprites:
+            if self.__is_drawable(sprite):
+                self.__draw_sprite(screen, sprite)
+                self.__drawn_rects[sprite] = sprite.rect.copy()
+            if sprite.dirty == 1:
+                sprite.dirty = 0
+
+        self.__drawn_state = state_type
+        self.__full_redraw = False
+        return [screen.get_rect()]
+
+    def __invalidate_drawing_orders(self, group_type : GroupType) -> None:
+        for (state_type, group_types) in self.__group_types.items():
+            if group_type in group_types:
+                self.__drawing_orders.pop(state_type, None)
+
+    def __get_drawing_order(self, state_type : StateType) -> list['ChessrSprite']:
+        sprites = self.__drawing_orders.get(state_type, None)
+        if sprites is None:
+            sprites = []
+            for t in self.__group_types[state_type]:
+                sprites.extend(self.__queues[t].ordered)
+            self.__drawing_orders[state_type] = sprites
+        return sprites
+
+    def __merge_rects(self, rects : list[pg.Rect], bounds : pg.Rect) -> list[pg.Rect]:
+        merged : list[pg.Rect] = []
+        for rect in rects:
+            rect = rect.clip(bounds)
+            if rect.w <= 0 or rect.h <= 0:
+                continue
+            index = rect.collidelist(merged)
+            while not index == -1:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
+
+    def __is_drawable(self, sprite : pg.sprite.DirtySprite) -> bool:
+        return bool(sprite.visible) and not sprite.image is None and not sprite.rect is None
+
+    def __draw_sprite(self, screen : pg.surface.Surface, sprite : pg.sprite.DirtySprite) -> None:
+        screen.blit(sprite.image, sprite.rect, sprite.source_rect, sprite.blendmode)
+
+#endregion
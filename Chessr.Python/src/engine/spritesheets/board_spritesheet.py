@@ -3,6 +3,7 @@ from enum import auto
 import pygame as pg
 from src.engine.file_manager import FileManager
 from src.engine.spritesheets.spritesheet import Spritesheet
+from src.engine.surface_cache import SurfaceCache
 from src.utils.enums import ArrayEnum
 from src.utils.helpers import scale_rect
 
@@ -17,11 +18,45 @@ class BoardColour(ArrayEnum):
 
 class BoardSpritesheet(Spritesheet):
 
+    PATH = 'board.png'
     BOARD_WIDTH = 16
     BOARD_HEIGHT = 20
 
-    def __init__(self, file_manager : FileManager) -> None:
-        super().__init__(file_manager, 'board.png')
+    def __init__(self, file_manager : FileManager, sheet_cache : SurfaceCache) -> None:
+        super().__init__(file_manager, BoardSpritesheet.PATH, sheet_cache)
+
+    def get_board_image(
+        self,
+        colour_scheme : BoardColour,
+        scale : float,
+        width : int,
+        height : int
+    ) -> pg.surface.Surface:
+        scale = Spritesheet.quantise_scale(scale)
+
+        def create() -> pg.surface.Surface:
+            if width <= 0 or height <= 0:
+                return pg.Surface((0, 0), pg.SRCALPHA, 32)
+
+            sheet = self.get_sheet(scale)
+            cell_size = BoardSpritesheet.BOARD_WIDTH * scale
+            src_rects = {
+                c : BoardSpritesheet.get_src_rect(colour_scheme, c, scale) for c in CellColour
+            }
+            cell_height = src_rects[CellColour.LIGHT].h
+            size = (int(cell_size * width), int(cell_size * (height - 1)) + cell_height)
+            image = pg.Surface(size, pg.SRCALPHA, 32).convert_alpha()
+            for i in range(height):
+                for j in range(width):
+                    src_rect = src_rects[BoardSpritesheet.get_cell_colour(i, j)]
+                    image.blit(sheet, (int(j * cell_size), int(i * cell_size)), src_rect)
+            return image
+
+        return self.sheet_cache.get((self, colour_scheme, scale, width, height), create)
+
+    @staticmethod
+    def get_cell_colour(i : int, j : int) -> CellColour:
+        return CellColour.LIGHT if (i + j) % 2 == 1 else CellColour.DARK
 
     @staticmethod
     def get_src_rect(
@@ -35,5 +70,5 @@ class BoardSpritesheet(Spritesheet):
             BoardSpritesheet.BOARD_WIDTH,
             BoardSpritesheet.BOARD_HEIGHT
         )
-        scale_rect(r, scale)
+        scale_rect(r, Spritesheet.quantise_scale(scale))
         return r
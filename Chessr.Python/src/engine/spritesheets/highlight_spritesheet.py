@@ -4,6 +4,7 @@ import pygame as pg
 from src.engine.file_manager import FileManager
 from src.engine.spritesheets.board_spritesheet import BoardColour
 from src.engine.spritesheets.spritesheet import Spritesheet
+from src.engine.surface_cache import SurfaceCache
 from src.utils.enums import ArrayEnum
 from src.utils.helpers import scale_rect
 
@@ -13,11 +14,12 @@ class CellHighlightType(ArrayEnum):
 
 class HighlightSpritesheet(Spritesheet):
 
+    PATH = 'highlights.png'
     HIGHLIGHT_WIDTH = 16
     HIGHLIGHT_HEIGHT = 20
 
-    def __init__(self, file_manager : FileManager) -> None:
-        super().__init__(file_manager, 'highlights.png')
+    def __init__(self, file_manager : FileManager, sheet_cache : SurfaceCache) -> None:
+        super().__init__(file_manager, HighlightSpritesheet.PATH, sheet_cache)
 
     @staticmethod
     def get_src_rect(
@@ -31,5 +33,5 @@ class HighlightSpritesheet(Spritesheet):
             HighlightSpritesheet.HIGHLIGHT_WIDTH,
             HighlightSpritesheet.HIGHLIGHT_HEIGHT
         )
-        scale_rect(r, scale)
+        scale_rect(r, Spritesheet.quantise_scale(scale))
         return r
@@ -4,6 +4,7 @@ import pygame as pg
 from backend import PieceType, Player
 from src.engine.file_manager import FileManager
 from src.engine.spritesheets.spritesheet import Spritesheet
+from src.engine.surface_cache import SurfaceCache
 from src.utils.enums import ArrayEnum
 from src.utils.helpers import scale_rect
 
@@ -15,11 +16,27 @@ class PieceColour(ArrayEnum):
 
 class PieceSpritesheet(Spritesheet):
 
+    PATH = 'pieces.png'
     PIECE_WIDTH = 16
     PIECE_HEIGHT = 48
 
-    def __init__(self, file_manager : FileManager) -> None:
-        super().__init__(file_manager, 'pieces.png')
+    def __init__(self, file_manager : FileManager, sheet_cache : SurfaceCache) -> None:
+        super().__init__(file_manager, PieceSpritesheet.PATH, sheet_cache)
+
+    def get_piece_image(
+        self,
+        colour : PieceColour,
+        piece_type : PieceType,
+        player : Player,
+        scale : float = 1
+    ) -> pg.surface.Surface:
+        scale = Spritesheet.quantise_scale(scale)
+
+        def create() -> pg.surface.Surface:
+            src_rect = PieceSpritesheet.get_src_rect(colour, piece_type, player, scale)
+            return self.get_sheet(scale).subsurface(src_rect).copy()
+
+        return self.sheet_cache.get((self, colour, piece_type, player, scale), create)
 
     @staticmethod
     def get_src_rect(
@@ -35,5 +52,5 @@ class PieceSpritesheet(Spritesheet):
             PieceSpritesheet.PIECE_WIDTH,
             PieceSpritesheet.PIECE_HEIGHT
         )
-        scale_rect(r, scale)
+        scale_rect(r, Spritesheet.quantise_scale(scale))
         return r
@@ -3,6 +3,7 @@ from enum import auto
 import pygame as pg
 from src.engine.file_manager import FileManager
 from src.engine.spritesheets.spritesheet import Spritesheet
+from src.engine.surface_cache import SurfaceCache
 from src.utils.enums import ArrayEnum
 from src.utils.helpers import scale_rect
 
@@ -13,11 +14,34 @@ class ShadowType(ArrayEnum):
 
 class ShadowSpritesheet(Spritesheet):
 
+    PATH = 'shadows.png'
     SHADOW_WIDTH = 16
     SHADOW_HEIGHT = 7
+    ALPHA_LEVELS = 32
 
-    def __init__(self, file_manager : FileManager) -> None:
-        super().__init__(file_manager, 'shadows.png')
+    def __init__(self, file_manager : FileManager, sheet_cache : SurfaceCache) -> None:
+        super().__init__(file_manager, ShadowSpritesheet.PATH, sheet_cache)
+
+    def get_shadow_image(
+        self,
+        shadow_type : ShadowType,
+        scale : float = 1,
+        alpha : int = 255
+    ) -> pg.surface.Surface:
+        scale = Spritesheet.quantise_scale(scale)
+        alpha = ShadowSpritesheet.quantise_alpha(alpha)
+
+        def create() -> pg.surface.Surface:
+            image = self.get_image(ShadowSpritesheet.get_src_rect(shadow_type, scale), scale)
+            image.set_alpha(alpha)
+            return image
+
+        return self.sheet_cache.get((self, shadow_type, scale, alpha), create)
+
+    @staticmethod
+    def quantise_alpha(alpha : int) -> int:
+        steps = ShadowSpritesheet.ALPHA_LEVELS - 1
+        return round(round(alpha * steps / 255) * 255 / steps)
 
     @staticmethod
     def get_src_rect(shadow_type : ShadowType, scale : float = 1) -> pg.Rect:
@@ -27,5 +51,5 @@ class ShadowSpritesheet(Spritesheet):
             ShadowSpritesheet.SHADOW_WIDTH,
             ShadowSpritesheet.SHADOW_HEIGHT
         )
-        scale_rect(r, scale)
+        scale_rect(r, Spritesheet.quantise_scale(scale))
         return r
@@ -2,15 +2,17 @@ import pygame as pg
 
 from src.engine.file_manager import FileManager
 from src.engine.spritesheets.spritesheet import Spritesheet
+from src.engine.surface_cache import SurfaceCache
 from src.utils.helpers import scale_rect
 
 
 class SpinnerSpritesheet(Spritesheet):
 
+    PATH = 'spinner.png'
     SPINNER_WIDTH = SPINNER_HEIGHT = 172
 
-    def __init__(self, file_manager : FileManager) -> None:
-        super().__init__(file_manager, 'spinner.png')
+    def __init__(self, file_manager : FileManager, sheet_cache : SurfaceCache) -> None:
+        super().__init__(file_manager, SpinnerSpritesheet.PATH, sheet_cache)
 
     @staticmethod
     def get_src_rect(
@@ -26,5 +28,5 @@ class SpinnerSpritesheet(Spritesheet):
             SpinnerSpritesheet.SPINNER_WIDTH,
             SpinnerSpritesheet.SPINNER_HEIGHT
         )
-        scale_rect(r, scale)
+        scale_rect(r, Spritesheet.quantise_scale(scale))
         return r
@@ -1,25 +1,43 @@
 import pygame as pg
 from src.utils.path import PathLike
 from src.engine.file_manager import FileManager
+from src.engine.surface_cache import SurfaceCache
 
 class Spritesheet():
 
-    def __init__(self, file_manager : FileManager, pathlike : PathLike) -> None:
+    scale_step : float = 1 / 64
+
+    def __init__(self, file_manager : FileManager, pathlike : PathLike, sheet_cache : SurfaceCache) -> None:
         super().__init__()
-        self.__sheets : dict[float, pg.surface.Surface] = {
-            1 : file_manager.load_image(pathlike, True)
-        }
+        self.__file_manager = file_manager
+        self.__pathlike = pathlike
+        self.__source = file_manager.load_image(pathlike, True)
+        self.__sheet_cache = sheet_cache
     
     def get_sheet(self, scale : float = 1) -> pg.surface.Surface:
-        if scale in self.__sheets:
-            return self.__sheets[scale]
+        scale = Spritesheet.quantise_scale(scale)
+        if scale == 1:
+            return self.__source
         
-        src = self.__sheets[1]
-        scaled_size = tuple(map(lambda x: int(x * scale), src.get_size()))
-        self.__sheets[scale] = pg.transform.scale(src, scaled_size)
-        return self.__sheets[scale]
+        def create() -> pg.surface.Surface:
+            packed = self.__file_manager.load_packed_image(self.__pathlike, scale, True)
+            if not packed is None:
+                return packed
+            src = self.__source
+            scaled_size = tuple(map(lambda x: int(x * scale), src.get_size()))
+            return pg.transform.scale(src, scaled_size)
+        return self.__sheet_cache.get((self, scale), create)
 
     def get_image(self, src_rect : pg.Rect, scale : float) -> pg.surface.Surface:
         image = pg.Surface(src_rect.size, pg.SRCALPHA, 32).convert_alpha()
         image.blit(self.get_sheet(scale), (0, 0), src_rect)
         return image
+
+    @staticmethod
+    def quantise_scale(scale : float) -> float:
+        step = Spritesheet.scale_step
+        return round(scale / step) * step
+
+    @property
+    def sheet_cache(self) -> SurfaceCache:
+        return self.__sheet_cache
@@ -0,0 +1,229 @@
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from importlib.abc import Loader, MetaPathFinder
+from importlib.machinery import ModuleSpec
+from types import ModuleType
+from typing import Any, Iterator, Optional, Sequence
+
+
+class StartupPhase:
+
+    def __init__(self, name : str, start : float, duration : float, thread : str) -> None:
+        self.__name = name
+        self.__start = start
+        self.__duration = duration
+        self.__thread = thread
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @property
+    def start(self) -> float:
+        return self.__start
+
+    @property
+    def duration(self) -> float:
+        return self.__duration
+
+    @property
+    def thread(self) -> str:
+        return self.__thread
+
+class ImportRecord:
+
+    def __init__(self, module : str) -> None:
+        self.__module = module
+        self.__self_time : float = 0
+        self.__cumulative_time : float = 0
+
+    def add(self, self_time : float, cumulative_time : float) -> None:
+        self.__self_time += self_time
+        self.__cumulative_time += cumulative_time
+
+    @property
+    def module(self) -> str:
+        return self.__module
+
+    @property
+    def self_time(self) -> float:
+        return self.__self_time
+
+    @property
+    def cumulative_time(self) -> float:
+        return self.__cumulative_time
+
+    @property
+    def package(self) -> str:
+        parts = self.__module.split('.')
+        if parts[0] == 'src' and len(parts) > 2:
+            return '.'.join(parts[:2])
+        return parts[0]
+
+class TimedLoader(Loader):
+
+    def __init__(self, loader : Loader, profiler : 'ImportProfiler') -> None:
+        self.__loader = loader
+        self.__profiler = profiler
+
+    def create_module(self, spec : ModuleSpec) -> Optional[ModuleType]:
+        start = self.__profiler.enter()
+        try:
+            return self.__loader.create_module(spec)
+        finally:
+            self.__profiler.exit(spec.name, start)
+
+    def exec_module(self, module : ModuleType) -> None:
+        start = self.__profiler.enter()
+        try:
+            self.__loader.exec_module(module)
+        finally:
+            self.__profiler.exit(module.__name__, start)
+            if not module.__spec__ is None and module.__spec__.loader is self:
+                module.__spec__.loader = self.__loader
+            if getattr(module, '__loader__', None) is self:
+                module.__loader__ = self.__loader
+
+    def __getattr__(self, name : str) -> Any:
+        return getattr(self.__loader, name)
+
+class ImportProfiler(MetaPathFinder):
+
+    def __init__(self) -> None:
+        self.__records : dict[str, ImportRecord] = {}
+        self.__lock = threading.Lock()
+        self.__local = threading.local()
+
+    def install(self) -> None:
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(
+        self,
+        fullname : str,
+        path : Optional[Sequence[str]],
+        target : Optional[ModuleType] = None
+    ) -> Optional[ModuleSpec]:
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if not spec.loader is None and hasattr(spec.loader, 'exec_module'):
+                spec.loader = TimedLoader(spec.loader, self)
+            return spec
+        return None
+
+    def enter(self) -> float:
+        self.__get_stack().append(0)
+        return time.perf_counter()
+
+    def exit(self, module : str, start : float) -> None:
+        duration = (time.perf_counter() - start) * 1000
+        stack = self.__get_stack()
+        children = stack.pop()
+        if len(stack) > 0:
+            stack[-1] += duration
+
+        with self.__lock:
+            record = self.__records.get(module, None)
+            if record is None:
+                record = ImportRecord(module)
+                self.__records[module] = record
+            record.add(duration - children, duration)
+
+    def __get_stack(self) -> list[float]:
+        stack = getattr(self.__local, 'stack', None)
+        if stack is None:
+            stack = []
+            self.__local.stack = stack
+        return stack
+
+    @property
+    def records(self) -> list[ImportRecord]:
+        with self.__lock:
+            return list(self.__records.values())
+
+class StartupProfiler:
+
+    __instance : Optional['StartupProfiler'] = None
+
+    @staticmethod
+    def get() -> 'StartupProfiler':
+        if StartupProfiler.__instance is None:
+            StartupProfiler.__instance = StartupProfiler()
+        return StartupProfiler.__instance
+
+    def __init__(self) -> None:
+        self.__enabled = False
+        self.__exit_on_finish = False
+        self.__origin = time.perf_counter()
+        self.__finish_time : Optional[float] = None
+        self.__phases : list[StartupPhase] = []
+        self.__lock = threading.Lock()
+        self.__import_profiler = ImportProfiler()
+
+    def enable(self, exit_on_finish : bool = True) -> None:
+        self.__enabled = True
+        self.__exit_on_finish = exit_on_finish
+        self.__origin = time.perf_counter()
+        self.__import_profiler.install()
+
+    def start(self) -> float:
+        return time.perf_counter()
+
+    def record(self, name : str, start : float, end : Optional[float] = None) -> None:
+        if not self.__enabled or not self.__finish_time is None:
+            return
+        end = time.perf_counter() if end is None else end
+        phase = StartupPhase(
+            name,
+            (start - self.__origin) * 1000,
+            (end - start) * 1000,
+            threading.current_thread().name)
+        with self.__lock:
+            self.__phases.append(phase)
+
+    @contextmanager
+    def measure(self, name : str) -> Iterator[None]:
+        start = self.start()
+        try:
+            yield
+        finally:
+            self.record(name, start)
+
+    def finish(self) -> bool:
+        if not self.__enabled or not self.__finish_time is None:
+            return False
+        self.__finish_time = time.perf_counter()
+        self.__import_profiler.uninstall()
+        return self.__exit_on_finish
+
+    @property
+    def enabled(self) -> bool:
+        return self.__enabled
+
+    @property
+    def finished(self) -> bool:
+        return not self.__finish_time is None
+
+    @property
+    def total_time(self) -> float:
+        end = time.perf_counter() if self.__finish_time is None else self.__finish_time
+        return (end - self.__origin) * 1000
+
+    @property
+    def phases(self) -> list[StartupPhase]:
+        with self.__lock:
+            return list(self.__phases)
+
+    @property
+    def imports(self) -> list[ImportRecord]:
+        return self.__import_profiler.records
@@ -1,15 +1,17 @@
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 
 import pygame as pg
 
+from src.engine.asset_loader import LoadingPhase, LoadJob
 from src.engine.factory import Factory
 from src.engine.state_type import StateType
 
 
 class State():
 
-    def __init__(self, state_type : StateType) -> None:
+    def __init__(self, state_type : StateType, prefetch_hint : Optional[StateType] = None) -> None:
         self.__state_type = state_type
+        self.__prefetch_hint = prefetch_hint
         self.__state_changer : Callable[[StateType, Any], None] = lambda _x, _y : None
 
     def provide_state_changer(self, state_changer : Callable[[StateType, Any], None]):
@@ -18,14 +20,25 @@ class State():
     @property
     def state_type(self):
         return self.__state_type
+
+    @property
+    def prefetch_hint(self) -> Optional[StateType]:
+        return self.__prefetch_hint
     
     def change_state(self, state_type : StateType, data : Any = None):
         self.__state_changer(state_type, data)
     
 #region Game Loop Methods
 
-    def load(self) -> None:
-        pass
+    def get_load_steps(self) -> list[tuple[str, Callable[[], None]]]:
+        return []
+
+    def get_load_jobs(self, dependencies : tuple[LoadJob, ...]) -> list[LoadJob]:
+        jobs : list[LoadJob] = []
+        for (name, step) in self.get_load_steps():
+            dependencies = dependencies if len(jobs) == 0 else (jobs[-1],)
+            jobs.append(LoadJob(LoadingPhase.STATES, step, True, dependencies, f'{type(self).__name__}.{name}'))
+        return jobs
 
     def start(self, data : Any) -> None:
         pass
@@ -36,6 +49,9 @@ class State():
     def update(self) -> None:
         pass
 
+    def is_busy(self) -> bool:
+        return False
+
 #endregion
 
 #region Events
@@ -2,7 +2,12 @@ from typing import Any, Optional
 
 import pygame as pg
 
+from src.engine.asset_loader import AssetLoader, LoadingPhase, LoadJob
 from src.engine.factory import Factory
+from src.engine.spritesheets.board_spritesheet import BoardSpritesheet
+from src.engine.spritesheets.highlight_spritesheet import HighlightSpritesheet
+from src.engine.spritesheets.piece_spritesheet import PieceSpritesheet
+from src.engine.spritesheets.shadow_spritesheet import ShadowSpritesheet
 from src.engine.state import State
 from src.engine.state_type import StateType
 from src.states.board_selection_state import BoardSelectionState
@@ -10,6 +15,8 @@ from src.states.game_state import GameState
 from src.states.loading_state import LoadingState
 from src.states.main_menu_state import MainMenuState
 
+PRELOADED_FONT_SIZES = (36, 108)
+PREFETCH_FRAME_BUDGET = 4
 
 class StateManager():
 
@@ -21,6 +28,9 @@ class StateManager():
             GameState()
         )
         self.__current_state : Optional[State] = None
+        self.__asset_loader : Optional[AssetLoader] = None
+        self.__loaded_states : set[StateType] = set()
+        self.__prefetch_loaders : dict[StateType, AssetLoader] = {}
 
         for state in self.__states:
             state.provide_state_changer(self.set_state)
@@ -29,17 +39,87 @@ class StateManager():
 
     def load_states(self):
         for state in self.__states:
-            state.load()
+            self.load_state(state.state_type)
+
+    def load_state(self, state_type : StateType) -> None:
+        if state_type in self.__loaded_states:
+            return
+
+        asset_loader = self.__prefetch_loaders.pop(state_type, None)
+        if asset_loader is None:
+            asset_loader = AssetLoader(self.get_state(state_type).get_load_jobs(()), 0)
+            asset_loader.start()
+        asset_loader.wait()
+        self.__loaded_states.add(state_type)
+
+    def prefetch(self, state_type : StateType) -> None:
+        if state_type in self.__loaded_states or state_type in self.__prefetch_loaders:
+            return
+
+        jobs = self.get_state(state_type).get_load_jobs(())
+        asset_loader = AssetLoader(jobs, frame_budget=PREFETCH_FRAME_BUDGET)
+        asset_loader.start()
+        self.__prefetch_loaders[state_type] = asset_loader
+
+    def start_loading(self, workers : Optional[int] = None) -> AssetLoader:
+        factory = Factory.get()
+        file_manager = factory.file_manager
+
+        jobs = [
+            LoadJob(LoadingPhase.FONTS, lambda x=x : file_manager.load_default_font(x), name=f'{x}pt')
+            for x in PRELOADED_FONT_SIZES
+        ]
+        spritesheets = (
+            (BoardSpritesheet.PATH, lambda : factory.board_spritesheet),
+            (HighlightSpritesheet.PATH, lambda : factory.highlight_spritesheet),
+            (PieceSpritesheet.PATH, lambda : factory.piece_spritesheet),
+            (ShadowSpritesheet.PATH, lambda : factory.shadow_spritesheet)
+        )
+        for (path, create) in spritesheets:
+            decode_job = LoadJob(
+                LoadingPhase.SPRITESHEETS,
+                lambda x=path : file_manager.decode_image(x),
+                name=f'decode {path}')
+            convert_job = LoadJob(LoadingPhase.SPRITESHEETS, create, True, (decode_job,), f'convert {path}')
+            jobs.extend((decode_job, convert_job))
+
+        dependencies = tuple(jobs)
+        jobs.extend(self.get_state(StateType.MAIN_MENU).get_load_jobs(dependencies))
+
+        self.__asset_loader = AssetLoader(jobs, workers)
+        self.__asset_loader.start()
+        self.set_state(StateType.LOADING, self.__asset_loader)
+        return self.__asset_loader
 
     def set_state(self, state_type : StateType, data : Any = None):
+        self.load_state(state_type)
         if not self.__current_state is None:
             self.__current_state.stop()
-        self.__current_state = next(x for x in self.__states if x.state_type == state_type)
+        self.__current_state = self.get_state(state_type)
         self.__current_state.start(data)
 
+        prefetch_hint = self.__current_state.prefetch_hint
+        if not prefetch_hint is None:
+            self.prefetch(prefetch_hint)
+        Factory.get().frame_scheduler.wake()
+
+    def get_state(self, state_type : StateType) -> State:
+        return next(x for x in self.__states if x.state_type == state_type)
+
     def update(self) -> None:
+        if not self.__asset_loader is None and self.__asset_loader.update():
+            self.__asset_loader = None
+            self.__loaded_states.add(StateType.MAIN_MENU)
+            self.set_state(StateType.MAIN_MENU)
         if not self.__current_state is None:
             self.__current_state.update()
+            if not self.__current_state.is_busy():
+                self.__update_prefetch()
+
+    def is_busy(self) -> bool:
+        if not self.__asset_loader is None or len(self.__prefetch_loaders) > 0:
+            return True
+        return not self.__current_state is None and self.__current_state.is_busy()
 
     def pass_event(self, event : pg.event.Event) -> None:
         if self.__current_state is None:
@@ -53,7 +133,16 @@ class StateManager():
         if event.type == pg.WINDOWSIZECHANGED:
             bounds = Factory.get().camera.bounds
             for state in self.__states:
-                state.on_view_change(bounds)
+                if state.state_type in self.__loaded_states:
+                    state.on_view_change(bounds)
+
+    def __update_prefetch(self) -> None:
+        if len(self.__prefetch_loaders) == 0:
+            return
+        state_type, asset_loader = next(iter(self.__prefetch_loaders.items()))
+        if asset_loader.update():
+            self.__prefetch_loaders.pop(state_type)
+            self.__loaded_states.add(state_type)
 
     @property
     def state_type(self) -> Optional[StateType]:
@@ -2,7 +2,7 @@ from enum import auto
 from typing import Optional
 
 from backend import PieceConfiguration
-from src.logic.board_data import BoardData
+from src.core.board_data import BoardData
 from src.utils.enums import ArrayEnum
 
 
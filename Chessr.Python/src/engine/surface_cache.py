@@ -0,0 +1,80 @@
+from collections import OrderedDict
+from threading import RLock
+from typing import Callable, Hashable
+
+import pygame as pg
+
+
+class SurfaceCache():
+
+    def __init__(self, byte_budget : int = 64 * 1024 * 1024) -> None:
+        self.__byte_budget = byte_budget
+        self.__surfaces : OrderedDict[Hashable, tuple[pg.surface.Surface, int]] = OrderedDict()
+        self.__lock = RLock()
+
+        self.__size = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def get(self, key : Hashable, create : Callable[[], pg.surface.Surface]) -> pg.surface.Surface:
+        with self.__lock:
+            entry = self.__surfaces.get(key, None)
+            if not entry is None:
+                self.__hits += 1
+                self.__surfaces.move_to_end(key)
+                return entry[0]
+
+            self.__misses += 1
+            surface = create()
+            size = surface.get_pitch() * surface.get_height()
+            self.__surfaces[key] = (surface, size)
+            self.__size += size
+            self.__evict()
+            return surface
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__surfaces.clear()
+            self.__size = 0
+
+    def __evict(self) -> None:
+        while self.__size > self.__byte_budget and len(self.__surfaces) > 1:
+            _, (_, size) = self.__surfaces.popitem(last = False)
+            self.__size -= size
+            self.__evictions += 1
+
+    @property
+    def byte_budget(self) -> int:
+        return self.__byte_budget
+
+    @byte_budget.setter
+    def byte_budget(self, byte_budget : int) -> None:
+        with self.__lock:
+            self.__byte_budget = byte_budget
+            self.__evict()
+
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    @property
+    def count(self) -> int:
+        return len(self.__surfaces)
+
+    @property
+    def hits(self) -> int:
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        return self.__misses
+
+    @property
+    def evictions(self) -> int:
+        return self.__evictions
+
+    @property
+    def hit_rate(self) -> float:
+        requests = self.__hits + self.__misses
+        return 0 if requests == 0 else self.__hits / requests
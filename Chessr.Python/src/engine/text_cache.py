@@ -0,0 +1,24 @@
+import pygame as pg
+
+from src.engine.file_manager import FileManager
+from src.engine.surface_cache import SurfaceCache
+from src.utils.helpers import Colour
+
+
+class TextCache(SurfaceCache):
+
+    def __init__(self, file_manager : FileManager, byte_budget : int = 16 * 1024 * 1024) -> None:
+        super().__init__(byte_budget)
+        self.__file_manager = file_manager
+
+    def render(
+        self,
+        font_name : str,
+        size : int,
+        text : str,
+        colour : Colour,
+        antialias : bool = True
+    ) -> pg.surface.Surface:
+        def create() -> pg.surface.Surface:
+            return self.__file_manager.load_font(font_name, size).render(text, antialias, colour)
+        return self.get((font_name, size, text, tuple(colour), antialias), create)
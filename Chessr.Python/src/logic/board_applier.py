@@ -1,6 +1,6 @@
 from backend import Player
+from src.core.board_data import BoardData
 from src.engine.spritesheets.piece_spritesheet import PieceColour
-from src.logic.board_data import BoardData
 from src.sprites.board.board import Board
 
 
@@ -1,65 +1,173 @@
-from threading import Thread
+from typing import Iterable, Optional
 
 import pygame as pg
 
 from src.engine.factory import Factory
+from src.engine.frame_profiler import ProfilerPhase
+from src.engine.frame_scheduler import SHOWN_EVENTS
+from src.engine.group_manager import GroupType, RenderMode
+from src.engine.startup_profiler import StartupProfiler
 from src.engine.state_manager import StateManager
 from src.engine.state_type import StateType
+from src.sprites.ui.profiler_overlay import ProfilerOverlay
+from src.utils.frame_clock import FrameClock
+from src.utils.helpers import Colour, IntVector
+from src.utils.tween import TweenManager
 
+BACKGROUND_COLOUR : Colour = (40, 40, 40)
 
 class Master:
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        starting_screen_size : IntVector = (1280, 720),
+        render_mode : RenderMode = RenderMode.DIRTY,
+        frame_clock : Optional[FrameClock] = None
+    ) -> None:
+        if not frame_clock is None:
+            FrameClock.set(frame_clock)
+        self.__frame_clock = FrameClock.get()
 
         factory = Factory.get()
-        camera = factory.camera
+        self.__camera = factory.camera
+        self.__group_manager = factory.group_manager
+        self.__profiler = factory.frame_profiler
+        self.__scheduler = factory.frame_scheduler
+        self.__tween_manager = TweenManager.get()
+        self.__startup_profiler = StartupProfiler.get()
+        startup_profiler = self.__startup_profiler
         file_manager = factory.file_manager
-        group_manager = factory.group_manager
-
-        pg.init()
-        pg.font.init()
-
-        starting_screen_size = (1280, 720)
-        screen = pg.display.set_mode(starting_screen_size, pg.RESIZABLE)
-        camera.on_view_change(*starting_screen_size)
-        
-        pg.display.set_icon(file_manager.load_image('icon.png', True))
-        pg.display.set_caption('Chessr')
-
-        state_manager = StateManager()
-
-        def load():
-            state_manager.load_states()
-            state_manager.set_state(StateType.MAIN_MENU)
-
-        loading_thread = Thread(target=load)
-        loading_thread.daemon = True
-        loading_thread.start()
-
-        running = True
-        clock = pg.time.Clock()
-        while running:
-            for event in pg.event.get():
-                if event.type == pg.QUIT:
-                    running = False
-                    continue
-                if event.type == pg.WINDOWSIZECHANGED:
-                    camera.on_view_change(
-                        event.__dict__['x'],
-                        event.__dict__['y'])
-                state_manager.pass_event(event)
-                
-            state_manager.update()
-            current_state = state_manager.state_type
-
-            screen.fill((40, 40, 40))
-
-            if current_state is not None:
-                group_manager.update_groups(current_state)
-                group_manager.draw_groups(screen, current_state)
 
-            pg.display.flip()
-
-            clock.tick(60)
+        with startup_profiler.measure('pg.init'):
+            pg.init()
+            pg.font.init()
+
+        with startup_profiler.measure('pg.display.set_mode'):
+            self.__screen = pg.display.set_mode(starting_screen_size, pg.RESIZABLE)
+            self.__camera.on_view_change(*starting_screen_size)
+
+        with startup_profiler.measure('asset pack'):
+            file_manager.load_asset_pack()
+
+        with startup_profiler.measure('icon'):
+            pg.display.set_icon(file_manager.load_image('icon.png', True))
+            pg.display.set_caption('Chessr')
+
+        self.__render_mode = render_mode
+        with startup_profiler.measure('StateManager'):
+            self.__state_manager = StateManager()
+        with startup_profiler.measure('ProfilerOverlay'):
+            self.__profiler_overlay = ProfilerOverlay((0, 0), GroupType.DEBUG)
+        self.__update_overlay_position()
+        self.__running = False
+
+    def run(self) -> None:
+        self.__state_manager.start_loading()
+
+        self.__running = True
+        while self.__running:
+            events = self.__scheduler.get_events()
+            self.begin_frame()
+            self.handle_events(events)
+            if self.__scheduler.should_render():
+                self.update()
+                self.present(self.draw())
+                self.end_frame()
+            self.__scheduler.end_frame(self.is_active())
 
         pg.quit()
+
+#region Frame Phases
+
+    def begin_frame(self) -> int:
+        return self.__frame_clock.advance()
+
+    def handle_events(self, events : Iterable[pg.event.Event]) -> None:
+        start = self.__profiler.start()
+        for event in events:
+            if event.type == pg.QUIT:
+                self.__running = False
+                continue
+            if event.type == pg.KEYDOWN:
+                self.__key_down(event)
+            if event.type == pg.WINDOWSIZECHANGED:
+                self.__camera.on_view_change(
+                    event.__dict__['x'],
+                    event.__dict__['y'])
+                self.__group_manager.invalidate()
+                self.__update_overlay_position()
+            if event.type in SHOWN_EVENTS:
+                self.__group_manager.invalidate()
+            self.__state_manager.pass_event(event)
+        self.__profiler.record(ProfilerPhase.EVENTS, start)
+
+    def update(self) -> None:
+        start = self.__profiler.start()
+        self.__tween_manager.update()
+        self.__profiler.record(ProfilerPhase.TWEENS, start)
+
+        start = self.__profiler.start()
+        self.__state_manager.update()
+        self.__profiler.record(ProfilerPhase.STATE_UPDATE, start)
+
+        current_state = self.__state_manager.state_type
+        if current_state is not None:
+            start = self.__profiler.start()
+            self.__group_manager.update_groups(current_state)
+            self.__profiler.record(ProfilerPhase.GROUP_UPDATE, start)
+
+    def draw(self) -> list[pg.Rect]:
+        current_state = self.__state_manager.state_type
+        if current_state is None:
+            return []
+        start = self.__profiler.start()
+        update_rects = self.__group_manager.draw_groups(
+            self.__screen,
+            BACKGROUND_COLOUR,
+            current_state,
+            self.__render_mode)
+        self.__profiler.record(ProfilerPhase.DRAW, start)
+        return update_rects
+
+    def present(self, update_rects : list[pg.Rect]) -> None:
+        start = self.__profiler.start()
+        if self.__render_mode is RenderMode.FULL:
+            pg.display.flip()
+        elif len(update_rects) > 0:
+            pg.display.update(update_rects)
+        self.__profiler.record(ProfilerPhase.FLIP, start)
+
+    def is_active(self) -> bool:
+        return self.__tween_manager.any_running() \
+            or self.__profiler_overlay.is_animating() \
+            or self.__state_manager.is_busy()
+
+    def end_frame(self) -> None:
+        current_state = self.__state_manager.state_type
+        sprite_counts = {} if current_state is None \
+            else self.__group_manager.get_sprite_counts(current_state)
+        self.__profiler.end_frame(sprite_counts)
+
+        if current_state == StateType.MAIN_MENU and self.__startup_profiler.finish():
+            self.__running = False
+
+#endregion
+
+    def __key_down(self, event : pg.event.Event) -> None:
+        if event.key == pg.K_F3:
+            self.__profiler_overlay.toggle()
+        elif event.key == pg.K_F4:
+            self.__profiler_overlay.set_export_path(self.__profiler.export_csv())
+
+    def __update_overlay_position(self) -> None:
+        buffer = 10
+        bounds = self.__camera.bounds
+        self.__profiler_overlay.set_position((bounds.right - buffer, bounds.top + buffer))
+
+    @property
+    def frame_clock(self) -> FrameClock:
+        return self.__frame_clock
+
+    @property
+    def state_manager(self) -> StateManager:
+        return self.__state_manager
@@ -4,9 +4,9 @@ import pygame as pg
 from backend import (ChangeConsequence, Consequence, ConsequenceType,
                      MoveConsequence, PieceType, RemoveConsequence)
 from src.engine.spritesheets.board_spritesheet import (BoardColour,
-                                                       BoardSpritesheet,
-                                                       CellColour)
+                                                       BoardSpritesheet)
 from src.logic.board_event import BoardDataType, BoardEvent, BoardEventType
+from src.sprites.board.board_background import BoardBackground
 from src.sprites.board.board_cell import BoardCell
 from src.sprites.board.piece import Piece
 from src.utils.enums import MouseButton
@@ -27,6 +27,7 @@ class Board():
         self.__colour = colour
         self.__scale = 3
         self.__cell_scale = 3.75
+        self.__background = BoardBackground((0, 0), colour, self.__cell_scale)
 
         self.__events : list[BoardEvent] = [] 
         self.__pressed_grid_position : Optional[IntVector] = None
@@ -40,10 +41,7 @@ class Board():
 
         self.__width = width
         self.__height = height
-
-        cell_colours = (CellColour.LIGHT, CellColour.DARK)
-        def calculate_cell_colour(i : int, j : int) -> CellColour:
-            return cell_colours[(i + j + 1) % len(cell_colours)]
+        self.__background.set_dimensions(width, height)
 
         cells : list[tuple[BoardCell]] = []
 
@@ -54,7 +52,7 @@ class Board():
                     (i, j),
                     (0, 0),
                     self.__colour,
-                    calculate_cell_colour(i, j),
+                    BoardSpritesheet.get_cell_colour(i, j),
                     self.__cell_scale,
                     self.__scale
                 )
@@ -64,13 +62,14 @@ class Board():
         self.__cells = tuple(cells)
 
     def set_position(self, x : int, y : int):
-        cell_size = BoardSpritesheet.BOARD_WIDTH * self.__cell_scale
+        cell_size = self.__get_cell_size()
         pixel_width = cell_size * self.width
         pixel_height = cell_size * self.height
         left = x - pixel_width / 2
         top = y - pixel_height / 2
 
         self.__bounds = pg.Rect(left, top, pixel_width, pixel_height)
+        self.__background.set_position((left, top))
 
         def calculate_cell_position(i : int, j : int) -> FloatVector:
             return (left + j * cell_size, top + i * cell_size)
@@ -81,9 +80,20 @@ class Board():
                 if not cell is None:
                     cell.set_position(calculate_cell_position(i, j))
 
+    def set_colour(self, colour : BoardColour) -> None:
+        if self.__colour == colour:
+            return
+        self.__colour = colour
+        self.__background.set_theme(colour)
+        for i in range(self.height):
+            for j in range(self.width):
+                cell = self.at(i, j)
+                if not cell is None:
+                    cell.set_theme(colour, BoardSpritesheet.get_cell_colour(i, j))
+
     def mouse_down(self, event : pg.event.Event) -> bool:
         if event.button == MouseButton.LEFT:
-            self.__pressed_grid_position = self.at_pixel_position(pg.mouse.get_pos())
+            self.__pressed_grid_position = self.at_pixel_position(event.pos)
             if not self.__pressed_grid_position is None:
                 return True
         return False
@@ -91,7 +101,7 @@ class Board():
     def mouse_up(self, event : pg.event.Event) -> bool:
         if event.button == MouseButton.LEFT:
             event_parsed = False
-            released = self.at_pixel_position(pg.mouse.get_pos())
+            released = self.at_pixel_position(event.pos)
 
             if self.__pressed_grid_position == released:
                 data = { BoardDataType.GRID_POSITION: self.__pressed_grid_position }
@@ -108,12 +118,14 @@ class Board():
         return self.__events.pop(0)
     
     def at_pixel_position(self, point : IntVector) -> Optional[IntVector]:
-        for i in range(self.height):
-            for j in range(self.width):
-                cell = self.at(i, j)
-                if not cell is None and cell.point_intersects(point):
-                    return cell.gxy
-        return None
+        if not self.__bounds.collidepoint(point):
+            return None
+        cell_size = self.__get_cell_size()
+        x, y = point
+        gxy = (int((y - self.__bounds.top) // cell_size), int((x - self.__bounds.left) // cell_size))
+        if not inbounds(self.width, self.height, gxy):
+            return None
+        return gxy
     
     def apply_consequences(self, consequences : list[Consequence]):
         for consequence in consequences:
@@ -184,6 +196,9 @@ class Board():
             return
         cell.remove_piece()
 
+    def __get_cell_size(self) -> float:
+        return BoardSpritesheet.BOARD_WIDTH * self.__cell_scale
+
 #region Properties, Getters, and Setters
 
     def at(self, i : int, j : int) -> Optional[BoardCell]:
@@ -0,0 +1,38 @@
+import pygame as pg
+from src.engine.factory import Factory
+from src.engine.group_manager import DrawingPriority, GroupType
+from src.engine.spritesheets.board_spritesheet import BoardColour
+from src.sprites.sprite import ChessrSprite
+from src.utils.helpers import FloatVector
+
+
+class BoardBackground(ChessrSprite):
+
+    def __init__(self, xy : FloatVector, colour_scheme : BoardColour, scale : float) -> None:
+        self.__colour_scheme = colour_scheme
+        self.__scale = scale
+        self.__width = 0
+        self.__height = 0
+
+        super().__init__(
+            xy,
+            GroupType.GAME_BOARD,
+            DrawingPriority.MINUS_ONE,
+            self.__get_image())
+
+    def set_dimensions(self, width : int, height : int) -> None:
+        self.__width = width
+        self.__height = height
+        self.image = self.__get_image()
+
+    def set_theme(self, colour_scheme : BoardColour) -> None:
+        self.__colour_scheme = colour_scheme
+        self.image = self.__get_image()
+
+    def __get_image(self) -> pg.surface.Surface:
+        spritesheet = Factory.get().board_spritesheet
+        return spritesheet.get_board_image(
+            self.__colour_scheme,
+            self.__scale,
+            self.__width,
+            self.__height)
@@ -3,7 +3,6 @@ from typing import Optional
 import pygame as pg
 from backend import PieceType, Player
 from src.engine.factory import Factory
-from src.engine.group_manager import GroupType
 from src.engine.spritesheets.board_spritesheet import BoardColour, CellColour
 from src.engine.spritesheets.highlight_spritesheet import CellHighlightType
 from src.engine.spritesheets.piece_spritesheet import (PieceColour,
@@ -34,20 +33,22 @@ class BoardCell(ChessrSprite):
         self.__piece : Optional[Piece] = None
 
         self.__selected = False
-        self.__highlight = BoardCellHighlight(xy, scale, self.__colour_scheme)
+        self.__highlight : Optional[BoardCellHighlight] = None
 
         image = Factory.get().board_spritesheet.get_sheet(scale)
-        super().__init__(xy, GroupType.GAME_BOARD, None, image, self.__get_src_rect(scale))
+        super().__init__(xy, None, None, image, self.__get_src_rect(scale))
  
     def delete(self):
         if self.__piece is not None:
             self.__piece.delete()
-        self.__highlight.delete()
+        if self.__highlight is not None:
+            self.__highlight.delete()
         super().delete()
 
     def set_position(self, xy : FloatVector, preserve_tween : bool = False) -> None:
         super().set_position(xy, preserve_tween)
-        self.__highlight.set_position(xy, preserve_tween)
+        if not self.__highlight is None:
+            self.__highlight.set_position(xy, preserve_tween)
 
         if self.__piece is None:
             return
@@ -110,11 +111,15 @@ class BoardCell(ChessrSprite):
             self.__piece.lift(None, 0, duration)
 
     def highlight(self, highlight_type : CellHighlightType) -> None:
+        if self.__highlight is None:
+            xy = (0, 0) if self.dst_rect is None else self.dst_rect.topleft
+            self.__highlight = BoardCellHighlight(xy, self.__scale, self.__colour_scheme)
         self.__highlight.set_theme(highlight_type, self.__colour_scheme)
         self.__highlight.set_visible(True)
 
     def unhighlight(self) -> None:
-        self.__highlight.set_visible(False)
+        if not self.__highlight is None:
+            self.__highlight.set_visible(False)
 
     def __get_src_rect(self, scale : Optional[float] = None) -> pg.Rect:
         scale = scale if not scale is None else self.__scale
@@ -27,7 +27,6 @@ class Piece(ChessrSprite):
         self.__colour = self.__fallback_colour = colour
 
         self.__scale = scale
-        image = Factory.get().piece_spritesheet.get_sheet(scale)
 
         self.__lift : float = 0
         self.__lift_tween : Optional[Tween] = None
@@ -39,9 +38,8 @@ class Piece(ChessrSprite):
             xy,
             GroupType.GAME_PIECE,
             None,
-            image,
-            self.__get_src_rect(scale),
-            Anchor.BOTTOM_LEFT)
+            self.__get_image(),
+            anchor=Anchor.BOTTOM_LEFT)
 
     def delete(self) -> None:
         self.__shadow.delete()
@@ -49,21 +47,27 @@ class Piece(ChessrSprite):
 
     def update(self, *args : list[Any]) -> None:
         if not self.__lift_tween is None:
-            self.__lift = self.__lift_tween.value
-            self.__update_shadow_alpha()
+            lift = self.__lift_tween.value
+            if not lift == self.__lift:
+                self.__lift = lift
+                self.__update_shadow_alpha()
+                self.invalidate_geometry()
             if self.__lift_tween.finished():
                 self.__lift_tween = None
         super().update()
 
+    def is_animating(self) -> bool:
+        return not self.__lift_tween is None or super().is_animating()
+
     def set_position(self, xy : FloatVector, preserve_tween : bool = False) -> None:
         super().set_position(xy, preserve_tween)
         self.__shadow.set_position(xy, preserve_tween)
         if not preserve_tween:
-            self.__lift_tween = None
+            self.__stop_lift_tween()
 
-    def _calculate_position(self, xy : FloatVector) -> FloatVector:
-        x, y = xy
-        return super()._calculate_position((x, y - self.__lift))
+    def _calculate_offset(self, size : tuple[int, int]) -> FloatVector:
+        x, y = super()._calculate_offset(size)
+        return (x, y - self.__lift)
 
     def lift(
         self,
@@ -73,6 +77,7 @@ class Piece(ChessrSprite):
         tween_type : TweenType = TweenType.EASE_OUT_SINE,
         pause : int = 0
     ) -> None:
+        self.__stop_lift_tween()
         self.__lift_tween = Tween(
             tween_type,
             self.__lift if start is None else 0,
@@ -80,23 +85,28 @@ class Piece(ChessrSprite):
             duration,
             pause)
         self.__lift_tween.restart()
+        self.activate()
 
     def change_type(self, piece_type : PieceType) -> None:
         self.__piece_type = piece_type
-        self.src_rect = self.__get_src_rect()
+        self.image = self.__get_image()
 
     def highlight(self) -> None:
         self.__colour = PieceColour.RED
-        self.src_rect = self.__get_src_rect()
+        self.image = self.__get_image()
 
     def unhighlight(self) -> None:
         self.__colour = self.__fallback_colour
-        self.src_rect = self.__get_src_rect()
+        self.image = self.__get_image()
 
-    def __get_src_rect(self, scale : Optional[float] = None) -> pg.Rect:
-        scale = scale if not scale is None else self.__scale
+    def __get_image(self) -> pg.surface.Surface:
         spritesheet = Factory.get().piece_spritesheet
-        return spritesheet.get_src_rect(self.__colour, self.__piece_type, self.__player, scale)
+        return spritesheet.get_piece_image(self.__colour, self.__piece_type, self.__player, self.__scale)
+
+    def __stop_lift_tween(self) -> None:
+        if not self.__lift_tween is None:
+            self.__lift_tween.stop()
+            self.__lift_tween = None
 
     def __update_shadow_alpha(self) -> None:
         alpha = 255 * (1 - self.__lift / 60.0) if not self.__lift == 0 else 0
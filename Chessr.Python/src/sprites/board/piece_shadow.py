@@ -1,6 +1,6 @@
 from src.engine.factory import Factory
 from src.engine.group_manager import DrawingPriority, GroupType
-from src.engine.spritesheets.shadow_spritesheet import ShadowType
+from src.engine.spritesheets.shadow_spritesheet import ShadowSpritesheet, ShadowType
 from src.sprites.sprite import ChessrSprite
 from src.utils.enums import Anchor
 from src.utils.helpers import FloatVector
@@ -10,12 +10,10 @@ class PieceShadow(ChessrSprite):
 
     def __init__(self, xy : FloatVector, scale : float) -> None:
         self.__type = ShadowType.DARK
-
-        spritesheet = Factory.get().shadow_spritesheet
-        image_src_rect = spritesheet.get_src_rect(self.__type, scale)
-        image = spritesheet.get_image(image_src_rect, scale)
-
         self.__scale = scale
+        self.__alpha = 255
+
+        image = Factory.get().shadow_spritesheet.get_shadow_image(self.__type, scale, self.__alpha)
 
         super().__init__(
             xy,
@@ -24,11 +22,17 @@ class PieceShadow(ChessrSprite):
             image,
             anchor=Anchor.BOTTOM_LEFT)
 
-    def _calculate_position(self, xy : FloatVector) -> FloatVector:
-        x, y = xy
-        return super()._calculate_position((x, y - 2 * self.__scale))
+        self.visible = int(self.__alpha > 0)
+
+    def _calculate_offset(self, size : tuple[int, int]) -> FloatVector:
+        x, y = super()._calculate_offset(size)
+        return (x, y - 2 * self.__scale)
 
     def set_alpha(self, alpha : int) -> None:
-        if self.image is None:
+        alpha = ShadowSpritesheet.quantise_alpha(alpha)
+        if alpha == self.__alpha:
             return
-        self.image.set_alpha(alpha)
+        self.__alpha = alpha
+        self.visible = int(alpha > 0)
+        if alpha > 0:
+            self.image = Factory.get().shadow_spritesheet.get_shadow_image(self.__type, self.__scale, alpha)
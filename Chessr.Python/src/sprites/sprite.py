@@ -24,14 +24,22 @@ class ChessrSprite(pg.sprite.DirtySprite):
 
         self.__group : Optional[GroupType] = None
         self.__drawing_priority : Optional[DrawingPriority] = drawing_priority
+        self.__image : Optional[pg.surface.Surface] = None
+        self.__anchor = anchor
+        self.__position_tween : Optional[Tween] = None
+        self.__raw_position : FloatVector = xy
+        self.dirty = 1
+        self.layer = 0
+        self.source_rect = None # type: ignore
+        self.dst_rect = None
+
+        self.__geometry_valid = False
+        self.__size : tuple[int, int] = (0, 0)
+        self.__offset : FloatVector = (0, 0)
 
-        self.dirty = 2
         self.group = group
         self.image = image
         self.src_rect = src_rect
-
-        self._anchor = anchor
-        self.__position_tween : Optional[Tween] = None
         
         self.set_position(xy)
     
@@ -46,24 +54,59 @@ class ChessrSprite(pg.sprite.DirtySprite):
     def delete(self) -> None:
         self.kill()
 
+    def is_animating(self) -> bool:
+        return not self.__position_tween is None
+
+    def activate(self) -> None:
+        if not self.__group is None:
+            Factory.get().group_manager.activate(self)
+
     def set_position(self, xy : FloatVector, preserve_tween : bool = False) -> None:
-        self.dst_rect = pg.Rect((0, 0), self._calculate_size())
+        if not preserve_tween:
+            self.__stop_position_tween()
+        if self.__geometry_valid and xy == self.__raw_position:
+            return
+        if not self.__geometry_valid:
+            self.__update_geometry()
 
         self.__raw_position = xy
-        
-        xy = self._calculate_position(xy)
-        if self.alive() and isinstance(self.group, GroupType):
-            layer = self._calculate_layer(xy)
-            Factory.get().group_manager.get_group(self.group, self.__drawing_priority).change_layer(self, layer)
 
-        self.dst_rect.x, self.dst_rect.y = int(xy[0]), int(xy[1])
-        
-        if not preserve_tween:
-            self.__position_tween = None
+        w, h = self.__size
+        x = xy[0] + self.__offset[0]
+        y = xy[1] + self.__offset[1]
+        left, top = int(x), int(y)
+
+        rect = self.dst_rect
+        if not rect is None and rect.x == left and rect.y == top and rect.w == w and rect.h == h:
+            return
+
+        layer = self._calculate_layer((x, y))
+        if layer != self.layer:
+            if self.alive() and isinstance(self.group, GroupType):
+                Factory.get().group_manager.get_group(self.group).change_layer(self, layer)
+            elif not self.alive():
+                self.layer = layer
+
+        if rect is None:
+            self.dst_rect = pg.Rect(left, top, w, h)
+        else:
+            rect.update(left, top, w, h)
+        self.mark_dirty()
+
+    def invalidate_geometry(self) -> None:
+        self.__geometry_valid = False
+        self.activate()
+
+    def mark_dirty(self) -> None:
+        if self.dirty < 2:
+            self.dirty = 1
 
     def tween_position(self, tween : Tween) -> None:
+        if not tween is self.__position_tween:
+            self.__stop_position_tween()
         self.__position_tween = tween
         self.__position_tween.restart()
+        self.activate()
 
     def move(
         self,
@@ -80,19 +123,18 @@ class ChessrSprite(pg.sprite.DirtySprite):
     def _calculate_layer(self, xy : FloatVector) -> int:
         return int(xy[1])
 
-    def _calculate_position(self, xy : FloatVector) -> FloatVector:
-        x, y = xy
-        w, h = self._calculate_size() if self.dst_rect is None else self.dst_rect.size
-        if self._anchor == Anchor.TOP_LEFT:
-            return xy
-        if self._anchor == Anchor.TOP_RIGHT:
-            return (x - w, y)
-        if self._anchor == Anchor.BOTTOM_LEFT:
-            return (x, y - h)
-        if self._anchor == Anchor.BOTTOM_RIGHT:
-            return (x - w, y - h)
-        if self._anchor == Anchor.CENTER:
-            return (x - w / 2, y - h / 2)
+    def _calculate_offset(self, size : tuple[int, int]) -> FloatVector:
+        w, h = size
+        if self.__anchor == Anchor.TOP_LEFT:
+            return (0, 0)
+        if self.__anchor == Anchor.TOP_RIGHT:
+            return (-w, 0)
+        if self.__anchor == Anchor.BOTTOM_LEFT:
+            return (0, -h)
+        if self.__anchor == Anchor.BOTTOM_RIGHT:
+            return (-w, -h)
+        if self.__anchor == Anchor.CENTER:
+            return (-w / 2, -h / 2)
         raise SystemExit('Unexpected anchor value.')
     
     def _calculate_size(self) -> FloatVector:
@@ -100,11 +142,28 @@ class ChessrSprite(pg.sprite.DirtySprite):
             return self.image.get_size() if not self.image is None else (0, 0)
         return self.src_rect.size
 
+    def _set_source_rect(self, src_rect : Optional[pg.rect.Rect]) -> bool:
+        if src_rect == self.source_rect:
+            return False
+        self.source_rect = src_rect # type: ignore
+        self.mark_dirty()
+        return True
+
     def point_intersects(self, point : FloatVector) -> bool:
         if self.dst_rect is None:
             return False
         return self.dst_rect.collidepoint(point)
 
+    def __update_geometry(self) -> None:
+        self.__size = pg.Rect((0, 0), self._calculate_size()).size
+        self.__offset = self._calculate_offset(self.__size)
+        self.__geometry_valid = True
+
+    def __stop_position_tween(self) -> None:
+        if not self.__position_tween is None:
+            self.__position_tween.stop()
+            self.__position_tween = None
+
     def __update_grouping(
         self,
         group : Optional[GroupType],
@@ -116,7 +175,8 @@ class ChessrSprite(pg.sprite.DirtySprite):
         self.__group = group
         self.__drawing_priority = drawing_priority
         if not self.__group is None:
-            group_manager.get_group(self.__group, self.__drawing_priority).add(self)
+            group_manager.get_group(self.__group).add(self)
+            group_manager.activate(self)
 
 #region User Input
 
@@ -149,13 +209,37 @@ class ChessrSprite(pg.sprite.DirtySprite):
     def group(self, group : Optional[GroupType]) -> None:
         self.__update_grouping(group, self.__drawing_priority)
 
+    @property
+    def anchor(self) -> Anchor:
+        return self.__anchor
+
+    @anchor.setter
+    def anchor(self, anchor : Anchor) -> None:
+        if anchor == self.__anchor:
+            return
+        self.__anchor = anchor
+        self.invalidate_geometry()
+
+    @property
+    def image(self) -> Optional[pg.surface.Surface]:
+        return self.__image
+
+    @image.setter
+    def image(self, image : Optional[pg.surface.Surface]) -> None:
+        if image is self.__image:
+            return
+        self.__image = image
+        self.mark_dirty()
+        self.invalidate_geometry()
+
     @property
     def src_rect(self) -> Optional[pg.rect.Rect]:
         return self.source_rect
 
     @src_rect.setter
     def src_rect(self, src_rect : Optional[pg.rect.Rect]) -> None:
-        self.source_rect = src_rect # type: ignore
+        if self._set_source_rect(src_rect):
+            self.invalidate_geometry()
 
     @property
     def dst_rect(self) -> Optional[pg.rect.Rect]:
@@ -3,6 +3,7 @@ from typing import Callable, Optional
 
 import pygame as pg
 
+from src.engine.factory import Factory
 from src.engine.group_manager import DrawingPriority
 from src.sprites.sprite import ChessrSprite, GroupType
 from src.sprites.ui.text import Text
@@ -13,6 +14,8 @@ TEXT_COLOUR : Colour = (240, 240, 240)
 ALT_TEXT_COLOUR : Colour = (200, 200, 200)
 BG_COLOUR : Colour = (30, 30, 30)
 BORDER_COLOUR : Colour = (50, 50, 50)
+BORDER_RADIUS = 20
+BORDER_WIDTH = 5
 
 class ButtonDisplayType(ArrayEnum):
     DEFAULT = auto()
@@ -71,11 +74,16 @@ class Button(ChessrSprite):
         width, height = size
         width = (width if min_width is None else max(min_width, width)) + buffer
         height += buffer
-        image = pg.Surface((width, height), pg.SRCALPHA)
-        rect = pg.Rect(0, 0, width, height)
-        pg.draw.rect(image, bg_colour, rect, border_radius=20)
-        pg.draw.rect(image, border_colour, rect, 5, border_radius=20)
-        return image
+
+        def create() -> pg.Surface:
+            image = pg.Surface((width, height), pg.SRCALPHA)
+            rect = pg.Rect(0, 0, width, height)
+            pg.draw.rect(image, bg_colour, rect, border_radius=BORDER_RADIUS)
+            pg.draw.rect(image, border_colour, rect, BORDER_WIDTH, border_radius=BORDER_RADIUS)
+            return image
+
+        key = (width, height, bg_colour, border_colour, BORDER_RADIUS)
+        return Factory.get().chrome_cache.get(key, create)
     
     def __change_display_type(self, display_type : ButtonDisplayType):
         self.image = self.__images[display_type]
@@ -101,23 +109,23 @@ class Button(ChessrSprite):
 
 #region User Input
 
-    def mouse_down(self, _event : pg.event.Event) -> bool:
-        if self.__mouse_intersects():
+    def mouse_down(self, event : pg.event.Event) -> bool:
+        if self.__mouse_intersects(event):
             self.__mouse_down = True
             self.__change_display_type(ButtonDisplayType.PRESSED)
             return True
         return False
     
-    def mouse_up(self, _event : pg.event.Event) -> bool:
-        if self.__mouse_intersects() and self.__mouse_down:
+    def mouse_up(self, event : pg.event.Event) -> bool:
+        if self.__mouse_intersects(event) and self.__mouse_down:
             self.__action()
             self.__mouse_down = False
             self.__change_display_type(ButtonDisplayType.DEFAULT)
             return True
         return False
 
-    def mouse_move(self, _event : pg.event.Event) -> None:
-        hovering = self.__mouse_intersects()
+    def mouse_move(self, event : pg.event.Event) -> None:
+        hovering = self.__mouse_intersects(event)
         if hovering:
             if not self.__hovering:
                 self.__change_display_type(ButtonDisplayType.HOVERED)
@@ -128,7 +136,7 @@ class Button(ChessrSprite):
                 self.__mouse_down = False
         self.__hovering = hovering
 
-    def __mouse_intersects(self) -> bool:
-        return self.point_intersects(pg.mouse.get_pos())
+    def __mouse_intersects(self, event : pg.event.Event) -> bool:
+        return self.point_intersects(event.pos)
 
 #endregion
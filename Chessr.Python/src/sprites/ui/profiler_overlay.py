@@ -0,0 +1,111 @@
+import os
+from typing import Any, Optional
+
+import pygame as pg
+
+from src.engine.factory import Factory
+from src.engine.file_manager import FileManager
+from src.engine.frame_profiler import ProfilerPhase
+from src.engine.group_manager import DrawingPriority, GroupType
+from src.sprites.sprite import ChessrSprite
+from src.utils.enums import Anchor
+from src.utils.helpers import Colour, FloatVector
+from src.utils.timer import Timer
+
+TEXT_COLOUR : Colour = (240, 240, 240)
+BG_COLOUR : tuple[int, int, int, int] = (20, 20, 20, 200)
+PADDING = 8
+COLUMN_GAP = 16
+FONT_SIZE = 14
+
+class ProfilerOverlay(ChessrSprite):
+
+    def __init__(self, xy : FloatVector, group : GroupType, refresh_time : int = 250) -> None:
+        self.__profiler = Factory.get().frame_profiler
+        self.__font = Factory.get().file_manager.load_default_font(FONT_SIZE)
+        self.__glyph_renderer = Factory.get().glyph_renderer
+        self.__refresh_timer = Timer(refresh_time)
+        self.__export_path : Optional[str] = None
+
+        super().__init__(
+            xy,
+            group,
+            DrawingPriority.PLUS_ONE,
+            pg.Surface((0, 0)),
+            anchor=Anchor.TOP_RIGHT)
+
+        self.visible = 0
+
+    def update(self, *args : list[Any]) -> None:
+        if self.visible and self.__refresh_timer.finished():
+            self.__refresh()
+        super().update(*args)
+
+    def is_animating(self) -> bool:
+        return bool(self.visible)
+
+    def toggle(self) -> None:
+        self.visible = int(not self.visible)
+        if self.visible:
+            self.__refresh()
+
+    def set_export_path(self, path : str) -> None:
+        self.__export_path = path
+        self.visible = 1
+        self.__refresh()
+
+    def __refresh(self) -> None:
+        self.__refresh_timer.restart()
+        self.image = self.__render(self.__get_rows())
+
+    def __get_rows(self) -> list[tuple[str, str]]:
+        profiler = self.__profiler
+        rows = [('fps', f'{profiler.get_fps():.1f}')]
+        for phase in sorted(ProfilerPhase):
+            average = profiler.get_phase_average(phase)
+            maximum = profiler.get_phase_max(phase)
+            rows.append((phase.name.lower(), f'{average:.2f} / {maximum:.2f} ms'))
+
+        backend_time = profiler.last_backend_time
+        rows.append(('backend', '-' if backend_time is None else f'{backend_time:.1f} ms'))
+
+        sheet_cache = Factory.get().sheet_cache
+        rows.append(('sheets', f'{sheet_cache.count} / {sheet_cache.size / 2 ** 20:.1f} MB'))
+        rows.append((
+            'sheet cache',
+            f'{sheet_cache.hits} hit / {sheet_cache.misses} miss / {sheet_cache.evictions} evict'))
+        text_cache = Factory.get().text_cache
+        rows.append((
+            'text cache',
+            f'{text_cache.count} / {100 * text_cache.hit_rate:.0f}% hit / {text_cache.evictions} evict'))
+
+        last_frame = profiler.last_frame
+        if not last_frame is None:
+            for group_type, count in last_frame.sprite_counts.items():
+                rows.append((group_type.name.lower(), str(count)))
+
+        if not self.__export_path is None:
+            rows.append(('export', os.path.basename(self.__export_path)))
+        return rows
+
+    def __render(self, rows : list[tuple[str, str]]) -> pg.surface.Surface:
+        rendered = [
+            (self.__render_text(x), self.__render_text(y))
+            for (x, y) in rows
+        ]
+        label_width = max(x.get_width() for (x, _) in rendered)
+        value_width = max(y.get_width() for (_, y) in rendered)
+        line_height = self.__font.get_linesize()
+
+        width = label_width + value_width + COLUMN_GAP + 2 * PADDING
+        height = line_height * len(rendered) + 2 * PADDING
+        image = pg.Surface((width, height), pg.SRCALPHA, 32)
+        image.fill(BG_COLOUR)
+        for (i, (label, value)) in enumerate(rendered):
+            y = PADDING + i * line_height
+            image.blit(label, (PADDING, y))
+            image.blit(value, (width - PADDING - value.get_width(), y))
+        return image
+
+    def __render_text(self, text : str) -> pg.surface.Surface:
+        return self.__glyph_renderer.render(FileManager.DEFAULT_FONT, FONT_SIZE, text, TEXT_COLOUR)
@@ -0,0 +1,50 @@
+import pygame as pg
+
+from src.engine.group_manager import DrawingPriority
+from src.sprites.sprite import ChessrSprite, GroupType
+from src.utils.enums import Anchor
+from src.utils.helpers import Colour, FloatVector, IntVector
+
+TRACK_COLOUR : Colour = (30, 30, 30)
+BORDER_COLOUR : Colour = (50, 50, 50)
+FILL_COLOUR : Colour = (200, 200, 200)
+BORDER_RADIUS = 10
+BORDER_WIDTH = 3
+
+class ProgressBar(ChessrSprite):
+
+    def __init__(
+        self,
+        xy : FloatVector,
+        size : IntVector,
+        anchor : Anchor,
+        group_type : GroupType,
+        drawing_priority : DrawingPriority = DrawingPriority.NORMAL
+    ):
+        self.__size = size
+        self.__progress : float = 0
+        self.__fill_width = 0
+        super().__init__(xy, group_type, drawing_priority, self.__create_image(0), anchor=anchor)
+
+    def set_progress(self, progress : float) -> None:
+        self.__progress = min(1, max(0, progress))
+        fill_width = int((self.__size[0] - 2 * BORDER_WIDTH) * self.__progress)
+        if fill_width == self.__fill_width:
+            return
+        self.__fill_width = fill_width
+        self.image = self.__create_image(fill_width)
+
+    def __create_image(self, fill_width : int) -> pg.Surface:
+        width, height = self.__size
+        image = pg.Surface((width, height), pg.SRCALPHA)
+        rect = pg.Rect(0, 0, width, height)
+        pg.draw.rect(image, TRACK_COLOUR, rect, border_radius=BORDER_RADIUS)
+        if fill_width > 0:
+            fill_rect = pg.Rect(BORDER_WIDTH, BORDER_WIDTH, fill_width, height - 2 * BORDER_WIDTH)
+            pg.draw.rect(image, FILL_COLOUR, fill_rect, border_radius=BORDER_RADIUS)
+        pg.draw.rect(image, BORDER_COLOUR, rect, BORDER_WIDTH, border_radius=BORDER_RADIUS)
+        return image
+
+    @property
+    def progress(self) -> float:
+        return self.__progress
@@ -26,6 +26,9 @@ class Spinner(ChessrSprite):
         self.src_rect = self.__get_src_rect()
         super().update(*args)
 
+    def is_animating(self) -> bool:
+        return True
+
     def __get_src_rect(self, scale : Optional[float] = None) -> pg.Rect:
         scale = scale if not scale is None else self.__scale
         spritesheet = Factory.get().spinner_spritesheet
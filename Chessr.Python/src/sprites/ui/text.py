@@ -1,15 +1,21 @@
+from enum import auto
 from typing import Any, Callable, Optional
 
 import pygame as pg
 
 from src.engine.factory import Factory
+from src.engine.file_manager import FileManager
 from src.engine.group_manager import DrawingPriority
 from src.sprites.sprite import ChessrSprite, GroupType
-from src.utils.enums import Anchor, Direction, ViewState
+from src.utils.enums import Anchor, ArrayEnum, Direction, ViewState
 from src.utils.helpers import Colour, FloatVector, IntVector
 from src.utils.tween import Tween, TweenType
 
 
+class TextRenderMode(ArrayEnum):
+    CACHED = auto()
+    GLYPH_ATLAS = auto()
+
 class Text(ChessrSprite):
 
     def __init__(
@@ -20,13 +26,16 @@ class Text(ChessrSprite):
         group_type : GroupType,
         drawing_priority : Optional[DrawingPriority] = None,
         state : ViewState = ViewState.VISIBLE,
-        slide_direction : Optional[Direction] = None
+        slide_direction : Optional[Direction] = None,
+        render_mode : TextRenderMode = TextRenderMode.CACHED
     ):
+        self.__render_mode = render_mode
         self.__slide : float = 1 if state == ViewState.VISIBLE else 0
         self.__slide_direction : Optional[Direction] = slide_direction
         self.__slide_tween : Optional[Tween] = None
 
-        self.__font = Factory.get().file_manager.load_default_font(int(size))
+        self.__font_size = int(size)
+        self.__font = Factory.get().file_manager.load_default_font(self.__font_size)
         self.__cache : dict[Any, pg.surface.Surface] = {}
 
         super().__init__(xy, group_type, drawing_priority, pg.Surface((0, 0)), anchor=anchor)
@@ -35,14 +44,14 @@ class Text(ChessrSprite):
 
     def update(self, *args : list[Any]) -> None:
         if not self.__slide_tween is None:
-            self.__slide = self.__slide_tween.value
+            self.__set_slide(self.__slide_tween.value)
             if self.__slide_tween.finished():
-                callback = self.__slide_tween.get_callback()
-                if not callback is None:
-                    callback()
                 self.__slide_tween = self.__slide_tween.get_chained()
         super().update()
 
+    def is_animating(self) -> bool:
+        return not self.__slide_tween is None or super().is_animating()
+
     def _calculate_size(self) -> FloatVector:
         if self.image is None:
             return (0, 0)
@@ -52,19 +61,19 @@ class Text(ChessrSprite):
         if self.__slide_direction in (Direction.LEFT, Direction.RIGHT):
             size = (self.__slide * w, h)
             x = 0 if self.__slide_direction == Direction.RIGHT else w - size[0]
-            self.src_rect = pg.Rect(x, 0, *size)
+            self._set_source_rect(pg.Rect(x, 0, *size))
         elif self.__slide_direction in (Direction.TOP, Direction.BOTTOM):
             size = (w, self.__slide * h)
             y = 0 if self.__slide_direction == Direction.BOTTOM else h - size[1]
-            self.src_rect = pg.Rect(0, y, *size)
+            self._set_source_rect(pg.Rect(0, y, *size))
 
         return size
     
-    def _calculate_position(self, xy : FloatVector) -> FloatVector:
-        x, y = xy
-        if self._anchor in (Anchor.BOTTOM_LEFT, Anchor.BOTTOM_RIGHT):
+    def _calculate_offset(self, size : tuple[int, int]) -> FloatVector:
+        x, y = super()._calculate_offset(size)
+        if self.anchor in (Anchor.BOTTOM_LEFT, Anchor.BOTTOM_RIGHT):
             y = y - self.__font.get_descent()
-        return super()._calculate_position((x, y))
+        return (x, y)
     
 #endregion
 
@@ -104,7 +113,11 @@ class Text(ChessrSprite):
         text : str,
         colour : Colour
     ) -> pg.surface.Surface:
-        return self.__font.render(text, True, colour)
+        if self.__render_mode is TextRenderMode.GLYPH_ATLAS:
+            renderer = Factory.get().glyph_renderer
+        else:
+            renderer = Factory.get().text_cache
+        return renderer.render(FileManager.DEFAULT_FONT, self.__font_size, text, colour)
 
 #endregion
 
@@ -122,8 +135,8 @@ class Text(ChessrSprite):
         return self.__slide_tween.end_value == (1 if state == ViewState.VISIBLE else 0)
 
     def set_state(self, state : ViewState):
-        self.__slide_tween = None
-        self.__slide = 1 if state == ViewState.VISIBLE else 0
+        self.__set_slide_tween(None)
+        self.__set_slide(1 if state == ViewState.VISIBLE else 0)
 
     def set_text_with_slide_by_key(self, key : Any, direction : Optional[Direction] = None) -> None:
         self.__slide_with_callback(direction, lambda : self.set_text_by_key(key))
@@ -162,9 +175,22 @@ class Text(ChessrSprite):
                 callback()
             tween = chain
 
-        self.__slide_tween = tween
-        if not direction is None:
+        self.__set_slide_tween(tween)
+        if not direction is None and not direction == self.__slide_direction:
             self.__slide_direction = direction
+            self.invalidate_geometry()
+
+    def __set_slide(self, slide : float) -> None:
+        if slide == self.__slide:
+            return
+        self.__slide = slide
+        self.invalidate_geometry()
+
+    def __set_slide_tween(self, tween : Optional[Tween]) -> None:
+        if not self.__slide_tween is None and not self.__slide_tween is tween:
+            self.__slide_tween.stop()
+        self.__slide_tween = tween
+        self.activate()
 
     def __slide_with_callback(self, direction : Optional[Direction], callback : Callable[[], None]):
         chain = self.__get_slide_tween(ViewState.VISIBLE, start=0, callback=callback)
@@ -186,7 +212,7 @@ class Text(ChessrSprite):
         end = 1 if state == ViewState.VISIBLE else 0
 
         if self.__at_destination(end):
-            self.__slide = end
+            self.__set_slide(end)
             return None
 
         return Tween(tween_type, start, end, 300, pause, chain, callback)
@@ -1,13 +1,13 @@
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import pygame as pg
 from backend import PieceConfiguration
-from src.engine.factory import Factory
+from src.core.board_data import BoardData
+from src.core.board_pack import BoardPack, BoardPackEntry
+from src.engine.asset_loader import LoadingPhase, LoadJob
 from src.engine.group_manager import GroupType
 from src.engine.state import State, StateType
 from src.engine.state_type import GameStateData
-from src.logic.board_data import BoardData
-from src.logic.board_loader import BoardLoader
 from src.sprites.ui.button import Button
 from src.sprites.ui.text import Text
 from src.utils.enums import Anchor, ViewState
@@ -16,42 +16,92 @@ from src.utils.enums import Anchor, ViewState
 class BoardSelectionState(State):
 
     def __init__(self) -> None:
-        super().__init__(StateType.BOARD_SELECTION)
+        super().__init__(StateType.BOARD_SELECTION, StateType.GAME)
 
         self.__title_text : Text
         self.__continue_button : Button
-        self.__board_data : tuple[BoardData]
-        self.__board_data_buttons : tuple[Button]
-        self.__chosen_board_data : Optional[BoardData] = None
+        self.__board_entries : Optional[tuple[BoardPackEntry, ...]] = None
+        self.__board_entry_buttons : tuple[Button]
+        self.__chosen_board_entry : Optional[BoardPackEntry] = None
 
         self.__piece_configuration = PieceConfiguration()
+        self.__board_pack = BoardPack()
 
 #region Game Loop Methods
 
-    def load(self) -> None:
-        board_loader = BoardLoader(self.__piece_configuration)
-        board_data : list[BoardData] = []
-        paths = Factory.get().file_manager.get_board_paths()
+    def get_load_steps(self) -> list[tuple[str, Callable[[], None]]]:
+        return [
+            ('board_buttons', self.__load_board_buttons),
+            ('title', self.__load_title),
+            ('continue_button', self.__load_continue_button),
+            ('view', self._update_view)
+        ]
 
-        for path in paths:
-            board_data.append(board_loader.load_board(path))
+    def get_load_jobs(self, dependencies : tuple[LoadJob, ...]) -> list[LoadJob]:
+        board_job = LoadJob(LoadingPhase.BOARDS, self.__load_board_entries, name='boards.pack')
+        return [board_job, *super().get_load_jobs((*dependencies, board_job))]
 
-        self.__board_data = tuple(board_data)
+    def start(self, data : Any) -> None:
+        self.__title_text.do_slide(ViewState.VISIBLE, pause=200)
+
+    def stop(self) -> None:
+        pass
+
+    def update(self) -> None:
+        pass
+    
+#endregion
+
+#region Events
+
+    def on_view_change(self, bounds : pg.rect.Rect):
+        buffer = 50
+        left = bounds.left + buffer
+        self.__title_text.set_position((left, bounds.top + buffer))
+        for (i, button) in enumerate(self.__board_entry_buttons):
+            button.set_position((left, bounds.top + 300 + i * 85))
+        self.__continue_button.set_position((bounds.right - buffer, bounds.bottom - buffer))
+
+    def mouse_down(self, event : pg.event.Event) -> bool:
+        for button in self.__board_entry_buttons:
+            if button.mouse_down(event):
+                return True
+        return self.__continue_button.mouse_down(event)
+    
+    def mouse_up(self, event : pg.event.Event) -> bool:
+        for button in self.__board_entry_buttons:
+            if button.mouse_up(event):
+                return True
+        return self.__continue_button.mouse_up(event)
+
+    def mouse_move(self, event : pg.event.Event) -> None:
+        for button in self.__board_entry_buttons:
+            button.mouse_move(event)
+        self.__continue_button.mouse_move(event)
+
+#endregion
 
-        def set_chosen_data_action(data : BoardData):
-            self.__chosen_board_data = data
+#region Private Methods
 
-        self.__board_data_buttons = tuple(
+    def __load_board_buttons(self) -> None:
+        if self.__board_entries is None:
+            self.__load_board_entries()
+
+        def set_chosen_entry_action(entry : BoardPackEntry):
+            self.__chosen_board_entry = entry
+
+        self.__board_entry_buttons = tuple(
             map(lambda x : Button(
                 (0, 0),
                 x.name,
-                lambda : set_chosen_data_action(x),
+                lambda : set_chosen_entry_action(x),
                 36,
                 Anchor.TOP_LEFT,
                 GroupType.BOARD_SELECTION_UI,
                 400),
-            self.__board_data))
+            self.__board_entries))
 
+    def __load_title(self) -> None:
         self.__title_text = Text(
             (0, 0),
             108,
@@ -60,12 +110,13 @@ class BoardSelectionState(State):
         )
         self.__title_text.set_text('Board Selection', (240, 240, 240))
 
+    def __load_continue_button(self) -> None:
         def continue_action():
             self.__title_text.do_slide(
                 ViewState.INVISIBLE,
                 callback=lambda : self.change_state(
                     StateType.GAME,
-                    GameStateData(self.__piece_configuration, self.__chosen_board_data)))
+                    GameStateData(self.__piece_configuration, self.__load_chosen_board())))
 
         self.__continue_button = Button(
             (0, 0),
@@ -75,45 +126,14 @@ class BoardSelectionState(State):
             Anchor.BOTTOM_RIGHT,
             GroupType.BOARD_SELECTION_UI,
             200)
-        
-        self._update_view()
-
-    def start(self, data : Any) -> None:
-        self.__title_text.do_slide(ViewState.VISIBLE, pause=200)
-
-    def stop(self) -> None:
-        pass
-
-    def update(self) -> None:
-        pass
-    
-#endregion
-
-#region Events
-
-    def on_view_change(self, bounds : pg.rect.Rect):
-        buffer = 50
-        left = bounds.left + buffer
-        self.__title_text.set_position((left, bounds.top + buffer))
-        for (i, button) in enumerate(self.__board_data_buttons):
-            button.set_position((left, bounds.top + 300 + i * 85))
-        self.__continue_button.set_position((bounds.right - buffer, bounds.bottom - buffer))
 
-    def mouse_down(self, event : pg.event.Event) -> bool:
-        for button in self.__board_data_buttons:
-            if button.mouse_down(event):
-                return True
-        return self.__continue_button.mouse_down(event)
-    
-    def mouse_up(self, event : pg.event.Event) -> bool:
-        for button in self.__board_data_buttons:
-            if button.mouse_up(event):
-                return True
-        return self.__continue_button.mouse_up(event)
+    def __load_board_entries(self) -> None:
+        self.__board_pack.sync(self.__piece_configuration)
+        self.__board_entries = self.__board_pack.get_entries()
 
-    def mouse_move(self, event : pg.event.Event) -> None:
-        for button in self.__board_data_buttons:
-            button.mouse_move(event)
-        self.__continue_button.mouse_move(event)
+    def __load_chosen_board(self) -> Optional[BoardData]:
+        if self.__chosen_board_entry is None:
+            return None
+        return self.__board_pack.load_board(self.__chosen_board_entry)
 
 #endregion
@@ -1,9 +1,12 @@
+import time
 from threading import Thread
 from typing import Any, Callable, Optional
 
 import pygame as pg
 from backend import ChessEngine, Consequence, MoveProperty, Player
 from backend import State as BackendState
+from src.core.engine_session import EngineSession
+from src.engine.factory import Factory
 from src.engine.group_manager import GroupType
 from src.engine.spritesheets.highlight_spritesheet import CellHighlightType
 from src.engine.state import State, StateType
@@ -31,7 +34,7 @@ class GameState(State):
         self.__coords_text : Text
         self.__back_button : Button
 
-        self.__engine : ChessEngine
+        self.__session : EngineSession
         self.__consequences : Optional[list[Consequence]] = None
         self.__pending_move_action : Optional[PendingMoveAction] = None
         self.__processing_thread : Optional[Thread] = None
@@ -39,52 +42,15 @@ class GameState(State):
 
 #region Game Loop Methods
 
-    def load(self) -> None:
-        self.__board_applier = BoardApplier()
-        self.__board = Board()
-
-        self.__turn_text = Text(
-            (0, 0),
-            36,
-            Anchor.BOTTOM_RIGHT,
-            GroupType.GAME_UI,
-            None,
-            ViewState.INVISIBLE,
-            Direction.RIGHT)
-        self.__turn_text.add_text(Player.WHITE, 'WHITE', (240, 240, 240))
-        self.__turn_text.add_text(Player.BLACK, 'BLACK', (240, 240, 240))
-
-        self.__state_text = Text(
-            (0, 0),
-            36,
-            Anchor.TOP_LEFT,
-            GroupType.GAME_UI,
-            None,
-            ViewState.INVISIBLE,
-            Direction.TOP)
-        self.__state_text.add_text(PROCESSING, 'Processing...', (240, 240, 240))
-        self.__state_text.add_text(BackendState.CHECK, 'Check', (240, 240, 240))
-        self.__state_text.add_text(BackendState.CHECKMATE, 'Checkmate', (240, 240, 240))
-        self.__state_text.add_text(BackendState.STALEMATE, 'Stalemate', (240, 240, 240))
-
-        self.__coords_text = Text(
-            (0, 0),
-            36,
-            Anchor.BOTTOM_LEFT,
-            GroupType.GAME_UI,
-            None,
-            ViewState.INVISIBLE,
-            Direction.LEFT)
-        
-        self.__back_button = Button(
-            (0, 0),
-            'Back',
-            lambda : self.change_state(StateType.MAIN_MENU),
-            36,
-            Anchor.TOP_LEFT,
-            GroupType.GAME_UI)
-
-        self._update_view()
+    def get_load_steps(self) -> list[tuple[str, Callable[[], None]]]:
+        return [
+            ('board', self.__load_board),
+            ('turn_text', self.__load_turn_text),
+            ('state_text', self.__load_state_text),
+            ('coords_text', self.__load_coords_text),
+            ('back_button', self.__load_back_button),
+            ('view', self._update_view)
+        ]
 
     def start(self, data : Any) -> None:
         if not isinstance(data, GameStateData) or data.board_data is None:
@@ -102,10 +68,10 @@ class GameState(State):
         self.__coords_text.set_state(ViewState.INVISIBLE)
         self.__state_text.set_state(ViewState.INVISIBLE)
 
-        self.__engine = ChessEngine(data.piece_configuration)
+        self.__session = EngineSession(data.piece_configuration, board_data)
         
         def process():
-            self.__engine.start(board_data.grid, board_data.starting_turn)
+            self.__session.start()
 
         self.__process_backend(process)
 
@@ -121,12 +87,12 @@ class GameState(State):
             self.__clear_pending_action()
             self.__deselect()
             self.__update_highlighting()
-            self.__turn_text.set_text_with_slide_by_key(self.__engine.get_current_player())
+            self.__turn_text.set_text_with_slide_by_key(self.__session.current_player)
 
-            self.__turn_text.set_text_by_key(self.__engine.get_current_player())
+            self.__turn_text.set_text_by_key(self.__session.current_player)
             self.__turn_text.set_state(ViewState.VISIBLE)
 
-            state = self.__engine.get_state()
+            state = self.__session.state
             if state == BackendState.NONE:
                 self.__state_text.do_slide(ViewState.INVISIBLE)
             else:
@@ -138,6 +104,9 @@ class GameState(State):
                 gxy = board_event.grid_position
                 self.__click(gxy)
             board_event = self.__board.pop_event()
+
+    def is_busy(self) -> bool:
+        return self.__is_processing()
     
 #endregion
 
@@ -178,14 +147,14 @@ class GameState(State):
             self.__pending_move_action.mouse_move(event)
 
         self.__back_button.mouse_move(event)
-        gxy = self.__board.at_pixel_position(pg.mouse.get_pos())
+        gxy = self.__board.at_pixel_position(event.pos)
         if gxy is None:
             if not self.__coords_text.is_tweening_to(ViewState.INVISIBLE):
                 pause = 500 if self.__coords_text.is_completely_visible() else 0
                 self.__coords_text.do_slide(ViewState.INVISIBLE, pause=pause)
         else:
-            coords = self.__engine \
-                .get_piece_configuration() \
+            coords = self.__session \
+                .piece_configuration \
                 .get_notation_from_coordinate(gxy, self.__board.height)
             self.__coords_text.set_text(coords.upper(), (240, 240, 240))
             if not self.__coords_text.is_tweening_to(ViewState.VISIBLE):
@@ -193,6 +162,59 @@ class GameState(State):
 
 #endregion
 
+#region Private Loading Methods
+
+    def __load_board(self) -> None:
+        self.__board_applier = BoardApplier()
+        self.__board = Board()
+
+    def __load_turn_text(self) -> None:
+        self.__turn_text = Text(
+            (0, 0),
+            36,
+            Anchor.BOTTOM_RIGHT,
+            GroupType.GAME_UI,
+            None,
+            ViewState.INVISIBLE,
+            Direction.RIGHT)
+        self.__turn_text.add_text(Player.WHITE, 'WHITE', (240, 240, 240))
+        self.__turn_text.add_text(Player.BLACK, 'BLACK', (240, 240, 240))
+
+    def __load_state_text(self) -> None:
+        self.__state_text = Text(
+            (0, 0),
+            36,
+            Anchor.TOP_LEFT,
+            GroupType.GAME_UI,
+            None,
+            ViewState.INVISIBLE,
+            Direction.TOP)
+        self.__state_text.add_text(PROCESSING, 'Processing...', (240, 240, 240))
+        self.__state_text.add_text(BackendState.CHECK, 'Check', (240, 240, 240))
+        self.__state_text.add_text(BackendState.CHECKMATE, 'Checkmate', (240, 240, 240))
+        self.__state_text.add_text(BackendState.STALEMATE, 'Stalemate', (240, 240, 240))
+
+    def __load_coords_text(self) -> None:
+        self.__coords_text = Text(
+            (0, 0),
+            36,
+            Anchor.BOTTOM_LEFT,
+            GroupType.GAME_UI,
+            None,
+            ViewState.INVISIBLE,
+            Direction.LEFT)
+
+    def __load_back_button(self) -> None:
+        self.__back_button = Button(
+            (0, 0),
+            'Back',
+            lambda : self.change_state(StateType.MAIN_MENU),
+            36,
+            Anchor.TOP_LEFT,
+            GroupType.GAME_UI)
+
+#endregion
+
 #region Private Game Logic Methods
 
     def __click(self, gxy : Optional[IntVector]) -> None:
@@ -205,10 +227,10 @@ class GameState(State):
             click_piece = self.__board.piece_at(*gxy)
             if gxy == self.__selected:
                 self.__deselect()
-            elif not click_piece is None and click_piece.player == self.__engine.get_current_player():
+            elif not click_piece is None and click_piece.player == self.__session.current_player:
                 self.__select(gxy)
             elif not self.__selected is None \
-                and (click_piece is None or not click_piece.player == self.__engine.get_current_player()):
+                and (click_piece is None or not click_piece.player == self.__session.current_player):
                 self.__execute_move(self.__selected, gxy)
 
         self.__update_highlighting()
@@ -240,13 +262,12 @@ class GameState(State):
         if self.__is_pending_action() or self.__is_processing():
             return
 
-        moves = tuple(x for x in self.__engine.get_current_moves() if x.moves_from(from_gxy))
-        move = next((x for x in moves if x.moves_to(to_gxy)), None)
+        move = self.__session.move_index.get_move(from_gxy, to_gxy)
         if move is None:
             return
 
         def process():
-            self.__consequences = self.__engine.make_move(move)
+            self.__consequences = self.__session.make_move(move)
 
         if not move.property is MoveProperty.PROMOTION:
             self.__process_backend(process)
@@ -266,7 +287,12 @@ class GameState(State):
             self.__state_text.set_text_by_key(PROCESSING)
             self.__state_text.do_slide(ViewState.VISIBLE, pause=200)
         
-        self.__processing_thread = Thread(target=process)
+        def timed_process():
+            start = time.perf_counter()
+            process()
+            Factory.get().frame_profiler.record_backend_call((time.perf_counter() - start) * 1000)
+
+        self.__processing_thread = Thread(target=timed_process)
         self.__processing_thread.daemon = True
         self.__processing_thread.start()
 
@@ -278,7 +304,7 @@ class GameState(State):
             self.__clear_highlights()
             return
         
-        moves = tuple(x for x in self.__engine.get_current_moves() if x.moves_from(self.__selected))
+        targets = self.__session.move_index.get_targets(self.__selected)
         for i in range(self.__board.height):
             for j in range(self.__board.width):
                 cell = self.__board.at(i, j)
@@ -286,7 +312,7 @@ class GameState(State):
                     continue
 
                 piece = cell.piece
-                if any(map(lambda x : x.moves_to((i, j)), moves)):
+                if (i, j) in targets:
                     if piece is None:
                         cell.highlight(CellHighlightType.MOVE)
                     else:
@@ -320,3 +346,23 @@ class GameState(State):
         return not self.__pending_move_action is None
 
 #endregion
+
+#region Properties
+
+    @property
+    def board(self) -> Board:
+        return self.__board
+
+    @property
+    def engine(self) -> ChessEngine:
+        return self.__session.engine
+
+    @property
+    def session(self) -> EngineSession:
+        return self.__session
+
+    @property
+    def processing(self) -> bool:
+        return self.__is_processing()
+
+#endregion
@@ -1,39 +1,86 @@
-from typing import Any
+from typing import Any, Optional, cast
 
 import pygame as pg
 
+from src.engine.asset_loader import AssetLoader, LoadingPhase
 from src.engine.group_manager import GroupType
 from src.engine.state import State, StateType
+from src.sprites.ui.progress_bar import ProgressBar
 from src.sprites.ui.spinner import Spinner
+from src.sprites.ui.text import Text, TextRenderMode
+from src.utils.enums import Anchor
+from src.utils.helpers import Colour
 
+TEXT_COLOUR : Colour = (240, 240, 240)
+ALT_TEXT_COLOUR : Colour = (160, 160, 160)
 
 class LoadingState(State):
 
     def __init__(self) -> None:
         super().__init__(StateType.LOADING)
+        self.__asset_loader : Optional[AssetLoader] = None
+        self.__labels : dict[Text, str] = {}
+
         self.__spinner = Spinner((0, 0), GroupType.LOADING)
+        self.__progress_bar = ProgressBar((0, 0), (400, 24), Anchor.CENTER, GroupType.LOADING)
+        self.__phase_text = Text(
+            (0, 0),
+            24,
+            Anchor.CENTER,
+            GroupType.LOADING,
+            render_mode=TextRenderMode.GLYPH_ATLAS)
+        self.__timing_text = Text(
+            (0, 0),
+            18,
+            Anchor.CENTER,
+            GroupType.LOADING,
+            render_mode=TextRenderMode.GLYPH_ATLAS)
         self._update_view()
 
 #region Game Loop Methods
 
-    def load(self) -> None:
-        pass
-
     def start(self, data : Any) -> None:
-        pass
+        self.__asset_loader = cast(Optional[AssetLoader], data)
 
     def stop(self) -> None:
-        pass
+        self.__asset_loader = None
 
     def update(self) -> None:
-        pass
+        asset_loader = self.__asset_loader
+        if asset_loader is None:
+            return
+
+        self.__progress_bar.set_progress(asset_loader.progress)
+
+        phase = asset_loader.phase
+        phase_label = '' if phase is None else f'Loading {phase.name.lower()}...'
+        timings = [
+            f'{x.name.lower()} {asset_loader.get_phase_time(x):.0f} ms'
+            for x in LoadingPhase
+            if asset_loader.get_phase_job_count(x) > 0 and asset_loader.get_phase_progress(x) == 1
+        ]
+        self.__set_label(self.__phase_text, phase_label, TEXT_COLOUR)
+        self.__set_label(self.__timing_text, '  '.join(timings), ALT_TEXT_COLOUR)
+
+    def is_busy(self) -> bool:
+        return not self.__asset_loader is None and not self.__asset_loader.finished
+
+    def __set_label(self, text : Text, label : str, colour : Colour) -> None:
+        if self.__labels.get(text, None) == label:
+            return
+        self.__labels[text] = label
+        text.set_text(label, colour)
     
 #endregion
 
 #region Events
 
     def on_view_change(self, bounds : pg.rect.Rect):
-        self.__spinner.set_position(bounds.center)
+        x, y = bounds.center
+        self.__spinner.set_position((x, y))
+        self.__phase_text.set_position((x, y + 125))
+        self.__progress_bar.set_position((x, y + 165))
+        self.__timing_text.set_position((x, y + 200))
 
     def mouse_down(self, event : pg.event.Event) -> bool:
         return False
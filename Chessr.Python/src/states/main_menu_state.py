@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Callable
 
 import pygame as pg
 
@@ -12,32 +12,19 @@ from src.utils.enums import Anchor
 class MainMenuState(State):
 
     def __init__(self) -> None:
-        super().__init__(StateType.MAIN_MENU)
+        super().__init__(StateType.MAIN_MENU, StateType.BOARD_SELECTION)
         
         self.__title_text : Text
         self.__button : Button
 
 #region Game Loop Methods
 
-    def load(self) -> None:
-        self.__title_text = Text(
-            (0, 0),
-            108,
-            Anchor.TOP_LEFT,
-            GroupType.MAIN_MENU_UI
-        )
-        self.__title_text.set_text('Chessr', (240, 240, 240))
-
-        self.__button = Button(
-            (0, 0),
-            'Play',
-            lambda : self.change_state(StateType.BOARD_SELECTION),
-            36,
-            Anchor.TOP_LEFT,
-            GroupType.MAIN_MENU_UI,
-            300)
-        
-        self._update_view()
+    def get_load_steps(self) -> list[tuple[str, Callable[[], None]]]:
+        return [
+            ('title', self.__load_title),
+            ('button', self.__load_button),
+            ('view', self._update_view)
+        ]
 
     def start(self, data : Any) -> None:
         pass
@@ -68,3 +55,26 @@ class MainMenuState(State):
         self.__button.mouse_move(event)
 
 #endregion
+
+#region Private Methods
+
+    def __load_title(self) -> None:
+        self.__title_text = Text(
+            (0, 0),
+            108,
+            Anchor.TOP_LEFT,
+            GroupType.MAIN_MENU_UI
+        )
+        self.__title_text.set_text('Chessr', (240, 240, 240))
+
+    def __load_button(self) -> None:
+        self.__button = Button(
+            (0, 0),
+            'Play',
+            lambda : self.change_state(StateType.BOARD_SELECTION),
+            36,
+            Anchor.TOP_LEFT,
+            GroupType.MAIN_MENU_UI,
+            300)
+
+#endregion
@@ -0,0 +1,31 @@
+import argparse
+import os
+
+import pygame as pg
+from src.engine.asset_pack import PACKED_IMAGES, AssetPack
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Builds the precompiled asset pack from the images folder.')
+    parser.add_argument('--check', action='store_true', help='only rebuild the pack if a source image changed')
+    args = parser.parse_args()
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pg.init()
+    pg.display.set_mode((1, 1))
+
+    asset_pack = AssetPack()
+    if args.check:
+        rebuilt = asset_pack.sync()
+    else:
+        asset_pack.build()
+        rebuilt = True
+        if not asset_pack.open():
+            raise SystemExit(f'The asset pack \'{asset_pack.path}\' could not be read after building it.')
+    entries = asset_pack.entry_count
+    size = os.path.getsize(asset_pack.path)
+    asset_pack.close()
+    pg.quit()
+
+    state = 'Built' if rebuilt else 'Up to date'
+    print(f'{state}: \'{asset_pack.path}\' ({len(PACKED_IMAGES)} images, {entries} entries, {size / 1024:.1f} KiB).')
@@ -0,0 +1,28 @@
+import argparse
+import os
+
+from backend import PieceConfiguration
+from src.core.board_pack import BoardPack
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Builds the binary board pack from the boards folder.')
+    parser.add_argument('--check', action='store_true', help='only rebuild the pack if a board file changed')
+    args = parser.parse_args()
+
+    piece_configuration = PieceConfiguration()
+    board_pack = BoardPack()
+    if args.check:
+        rebuilt = board_pack.sync(piece_configuration)
+    else:
+        board_pack.build(piece_configuration)
+        rebuilt = True
+        if not board_pack.open():
+            raise SystemExit(f'The board pack \'{board_pack.path}\' could not be read after building it.')
+    entries = board_pack.entry_count
+    invalid = sum(1 for x in board_pack.get_entries() if not x.valid)
+    size = os.path.getsize(board_pack.path)
+    board_pack.close()
+
+    state = 'Built' if rebuilt else 'Up to date'
+    print(f'{state}: \'{board_pack.path}\' ({entries} boards, {invalid} invalid, {size / 1024:.1f} KiB).')
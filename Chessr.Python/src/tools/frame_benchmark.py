@@ -0,0 +1,278 @@
+import argparse
+import json
+import os
+import platform
+import time
+from datetime import datetime, timezone
+from typing import Any, Iterable, Optional, cast
+
+import pygame as pg
+from backend import MoveProperty, PieceConfiguration
+from src.core.board_loader import BoardLoader
+from src.engine.factory import Factory
+from src.engine.group_manager import RenderMode
+from src.engine.state_type import GameStateData, StateType
+from src.master import Master
+from src.states.game_state import GameState
+from src.utils.enums import MouseButton
+from src.utils.frame_clock import FrameClock
+from src.utils.helpers import IntVector
+from src.utils.path import Path
+
+PHASES = ('update', 'draw', 'flip', 'total')
+PERCENTILES = (50, 90, 99)
+RESIZE_SIZES : tuple[IntVector, ...] = ((1600, 900), (960, 540), (1280, 720))
+
+def percentile(samples : list[float], p : float) -> float:
+    if len(samples) == 0:
+        return 0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(p / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+class FrameTimings:
+
+    def __init__(self) -> None:
+        self.__samples : dict[str, list[float]] = { phase : [] for phase in PHASES }
+
+    def add(self, update : float, draw : float, flip : float) -> None:
+        self.__samples['update'].append(update)
+        self.__samples['draw'].append(draw)
+        self.__samples['flip'].append(flip)
+        self.__samples['total'].append(update + draw + flip)
+
+    def summarise(self) -> dict[str, dict[str, float]]:
+        summary : dict[str, dict[str, float]] = {}
+        for phase, samples in self.__samples.items():
+            phase_summary = {
+                'mean_ms': sum(samples) / len(samples) if len(samples) > 0 else 0,
+                'max_ms': max(samples) if len(samples) > 0 else 0
+            }
+            for p in PERCENTILES:
+                phase_summary[f'p{p}_ms'] = percentile(samples, p)
+            summary[phase] = phase_summary
+        return summary
+
+    @property
+    def frames(self) -> int:
+        return len(self.__samples['total'])
+
+class FrameBenchmark:
+
+    def __init__(
+        self,
+        master : Master,
+        moves : int = 4,
+        fps : int = 60,
+        settle_time : int = 500,
+        engine_timeout : int = 30000
+    ) -> None:
+        self.__master = master
+        self.__moves = moves
+        self.__fps = fps
+        self.__settle_time = settle_time
+        self.__engine_timeout = engine_timeout
+
+        self.__piece_configuration = PieceConfiguration()
+        self.__board_loader = BoardLoader(self.__piece_configuration)
+        self.__clock = pg.time.Clock()
+        self.__timings = FrameTimings()
+
+    def run(self, paths : Iterable[Path]) -> list[dict[str, Any]]:
+        state_manager = self.__master.state_manager
+        state_manager.load_states()
+        return [self.run_board(path) for path in paths]
+
+    def run_board(self, path : Path) -> dict[str, Any]:
+        boards_folder = Path(('files', 'boards')).get_literal_path()
+        result : dict[str, Any] = {
+            'path': os.path.relpath(path.get_literal_path(), boards_folder).replace(os.sep, '/')
+        }
+
+        board_data = self.__board_loader.load_board(path)
+        result['name'] = board_data.name
+        result['valid'] = board_data.valid
+        result['width'] = board_data.width
+        result['height'] = board_data.height
+        if not board_data.valid:
+            result['description'] = board_data.description
+            return result
+
+        self.__timings = FrameTimings()
+        state_manager = self.__master.state_manager
+        game_state = cast(GameState, state_manager.get_state(StateType.GAME))
+        state_manager.set_state(
+            StateType.GAME,
+            GameStateData(self.__piece_configuration, board_data))
+
+        self.__wait_for_engine(game_state)
+        self.__settle()
+
+        moves_made = 0
+        for index in range(self.__moves):
+            move = self.__find_move(game_state, index)
+            if move is None:
+                break
+            from_gxy, to_gxy = move
+            self.__click(game_state, from_gxy)
+            self.__run_frames(10)
+            self.__click(game_state, to_gxy)
+            self.__wait_for_engine(game_state)
+            self.__settle()
+            moves_made += 1
+
+        self.__sweep_mouse(game_state)
+
+        for size in RESIZE_SIZES:
+            pg.display.set_mode(size, pg.RESIZABLE)
+            self.__run_frames(10)
+
+        result['moves'] = moves_made
+        result['frames'] = self.__timings.frames
+        result['phases'] = self.__timings.summarise()
+        return result
+
+#region Scripted Input
+
+    def __find_move(self, game_state : GameState, index : int) -> Optional[tuple[IntVector, IntVector]]:
+        board = game_state.board
+        engine = game_state.engine
+        player = engine.get_current_player()
+        moves = tuple(x for x in engine.get_current_moves() if not x.property is MoveProperty.PROMOTION)
+
+        for i in range(board.height):
+            for j in range(board.width):
+                piece = board.piece_at(i, j)
+                if piece is None or not piece.player == player:
+                    continue
+                candidates = tuple(x for x in moves if x.moves_from((i, j)))
+                if len(candidates) == 0:
+                    continue
+                move = candidates[index % len(candidates)]
+                for ti in range(board.height):
+                    for tj in range(board.width):
+                        if move.moves_to((ti, tj)):
+                            return ((i, j), (ti, tj))
+        return None
+
+    def __click(self, game_state : GameState, gxy : IntVector) -> None:
+        xy = self.__get_cell_centre(game_state, gxy)
+        self.__frame((
+            pg.event.Event(pg.MOUSEBUTTONDOWN, button=MouseButton.LEFT, pos=xy),
+            pg.event.Event(pg.MOUSEBUTTONUP, button=MouseButton.LEFT, pos=xy)))
+
+    def __sweep_mouse(self, game_state : GameState, steps : int = 60) -> None:
+        bounds = game_state.board.bounds.inflate(100, 100)
+        for step in range(steps):
+            t = step / float(steps - 1)
+            xy = (int(bounds.left + t * bounds.w), int(bounds.top + t * bounds.h))
+            self.__frame((pg.event.Event(pg.MOUSEMOTION, pos=xy, rel=(0, 0), buttons=(0, 0, 0)),))
+
+    def __get_cell_centre(self, game_state : GameState, gxy : IntVector) -> IntVector:
+        board = game_state.board
+        bounds = board.bounds
+        cell_size = bounds.w / board.width
+        i, j = gxy
+        return (int(bounds.left + (j + 0.5) * cell_size), int(bounds.top + (i + 0.5) * cell_size))
+
+#endregion
+
+#region Frame Logic
+
+    def __wait_for_engine(self, game_state : GameState) -> None:
+        deadline = pg.time.get_ticks() + self.__engine_timeout
+        self.__frame()
+        while game_state.processing and pg.time.get_ticks() < deadline:
+            self.__frame()
+
+    def __settle(self) -> None:
+        frame_clock = self.__master.frame_clock
+        deadline = frame_clock.time + self.__settle_time
+        while frame_clock.time < deadline:
+            self.__frame()
+
+    def __run_frames(self, frames : int) -> None:
+        for _ in range(frames):
+            self.__frame()
+
+    def __frame(self, events : Iterable[pg.event.Event] = ()) -> None:
+        master = self.__master
+        pending = pg.event.get()
+        master.begin_frame()
+        master.handle_events((*pending, *events))
+
+        start = time.perf_counter()
+        master.update()
+        updated = time.perf_counter()
+        update_rects = master.draw()
+        drawn = time.perf_counter()
+        master.present(update_rects)
+        presented = time.perf_counter()
+        master.end_frame()
+
+        self.__timings.add(
+            (updated - start) * 1000,
+            (drawn - updated) * 1000,
+            (presented - drawn) * 1000)
+
+        if self.__fps > 0:
+            self.__clock.tick(self.__fps)
+
+#endregion
+
+def print_report(results : list[dict[str, Any]]) -> None:
+    header = f'{"board":<36} {"size":>7} {"frames":>6}'
+    for phase in PHASES:
+        header += f' {phase + " p50/p99 ms":>18}'
+    print(header)
+    for result in results:
+        size = f'{result["width"]}x{result["height"]}'
+        if not result['valid']:
+            print(f'{result["path"]:<36} {size:>7} {"invalid":>6}')
+            continue
+        line = f'{result["path"]:<36} {size:>7} {result["frames"]:>6}'
+        for phase in PHASES:
+            timings = result['phases'][phase]
+            line += f' {timings["p50_ms"]:>8.2f}/{timings["p99_ms"]:<9.2f}'
+        print(line)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Headless frame-time benchmark over the bundled boards.')
+    parser.add_argument('--output', default='benchmark.json', help='the JSON file to write results to')
+    parser.add_argument('--moves', type=int, default=4, help='the number of moves to play on each board')
+    parser.add_argument('--fps', type=int, default=60, help='the frame rate to pace at, 0 to run unthrottled')
+    parser.add_argument('--render-mode', choices=('dirty', 'full'), default='dirty')
+    parser.add_argument('--fixed-step', type=int, default=None,
+        help='advance animations by this many milliseconds per frame instead of in real time')
+    args = parser.parse_args()
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    render_mode = RenderMode.DIRTY if args.render_mode == 'dirty' else RenderMode.FULL
+    frame_clock = None if args.fixed_step is None else FrameClock(args.fixed_step)
+    master = Master(render_mode=render_mode, frame_clock=frame_clock)
+
+    paths = sorted(
+        Factory.get().file_manager.get_board_paths(),
+        key=lambda x : x.get_literal_path())
+    benchmark = FrameBenchmark(master, args.moves, args.fps)
+    results = benchmark.run(paths)
+    pg.quit()
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'pygame': pg.version.ver,
+            'platform': platform.platform(),
+            'render_mode': render_mode.name,
+            'fps': args.fps,
+            'moves': args.moves,
+            'fixed_step': args.fixed_step
+        },
+        'boards': results
+    }
+    with open(args.output, 'w', encoding='utf8') as file:
+        json.dump(report, file, indent=2)
+
+    print_report(results)
+    print(f'Results written to \'{args.output}\'.')
@@ -0,0 +1,112 @@
+import argparse
+import json
+import os
+import platform
+from datetime import datetime, timezone
+from typing import Any
+
+from src.engine.startup_profiler import ImportRecord, StartupPhase, StartupProfiler
+
+IMPORT_ROWS = 25
+
+def get_package_times(imports : list[ImportRecord]) -> dict[str, tuple[float, int]]:
+    packages : dict[str, tuple[float, int]] = {}
+    for record in imports:
+        total, count = packages.get(record.package, (0, 0))
+        packages[record.package] = (total + record.self_time, count + 1)
+    return packages
+
+def print_report(
+    total_time : float,
+    phases : list[StartupPhase],
+    imports : list[ImportRecord]
+) -> None:
+    print(f'Startup took {total_time:.1f} ms to the first main menu frame.')
+
+    print()
+    print(f'{"phase":<40} {"start ms":>10} {"duration ms":>12}  thread')
+    for phase in sorted(phases, key=lambda x : -x.duration):
+        print(f'{phase.name:<40} {phase.start:>10.1f} {phase.duration:>12.2f}  {phase.thread}')
+
+    print()
+    print(f'{"package":<40} {"self ms":>10} {"modules":>12}')
+    packages = get_package_times(imports)
+    for (package, (total, count)) in sorted(packages.items(), key=lambda x : -x[1][0])[:IMPORT_ROWS]:
+        print(f'{package:<40} {total:>10.2f} {count:>12}')
+
+    print()
+    print(f'{"module":<40} {"self ms":>10} {"cumulative ms":>14}')
+    for record in sorted(imports, key=lambda x : -x.cumulative_time)[:IMPORT_ROWS]:
+        print(f'{record.module:<40} {record.self_time:>10.2f} {record.cumulative_time:>14.2f}')
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Profiles module imports and startup phases up to the main menu.')
+    parser.add_argument('--profile-startup', action='store_true', help='run the entry point in startup profiling mode')
+    parser.add_argument('--output', default=None, help='the JSON file to write results to')
+    parser.add_argument('--headless', action='store_true', help='use the dummy video driver')
+    args = parser.parse_args()
+
+    if args.headless:
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+    startup_profiler = StartupProfiler.get()
+    startup_profiler.enable()
+
+    with startup_profiler.measure('import'):
+        # pylint: disable=import-outside-toplevel
+        import pygame as pg
+        from src.master import Master
+        from src.utils.path import Path
+        # pylint: enable=import-outside-toplevel
+
+    with startup_profiler.measure('Master'):
+        master = Master()
+    master.run()
+
+    total_time = startup_profiler.total_time
+    phases = startup_profiler.phases
+    imports = startup_profiler.imports
+
+    output = args.output
+    if output is None:
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        output = Path(('profiles', f'startup_profile_{stamp}.json')).get_literal_path()
+        os.makedirs(os.path.dirname(output), exist_ok = True)
+
+    report : dict[str, Any] = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'pygame': pg.version.ver,
+            'platform': platform.platform(),
+            'completed': startup_profiler.finished
+        },
+        'total_ms': total_time,
+        'phases': [
+            {
+                'name': x.name,
+                'start_ms': x.start,
+                'duration_ms': x.duration,
+                'thread': x.thread
+            }
+            for x in sorted(phases, key=lambda x : x.start)
+        ],
+        'packages': {
+            x: { 'self_ms': total, 'modules': count }
+            for (x, (total, count)) in get_package_times(imports).items()
+        },
+        'imports': [
+            {
+                'module': x.module,
+                'package': x.package,
+                'self_ms': x.self_time,
+                'cumulative_ms': x.cumulative_time
+            }
+            for x in sorted(imports, key=lambda x : -x.cumulative_time)
+        ]
+    }
+    with open(output, 'w', encoding='utf8') as file:
+        json.dump(report, file, indent=2)
+
+    print_report(total_time, phases, imports)
+    print(f'Results written to \'{output}\'.')
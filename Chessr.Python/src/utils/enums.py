@@ -13,7 +13,7 @@ class CountEnum(IntEnum):
         return count + 1
 
 def enum_as_list(enum : EnumMeta) -> list[str]:
-    return [getattr(enum, name) for name in dir(enum) if not name.startswith('_')]
+    return [getattr(enum, name) for name in enum.__members__]
 
 #endregion
 
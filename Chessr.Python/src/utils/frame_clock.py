@@ -0,0 +1,45 @@
+from typing import Optional
+
+import pygame as pg
+
+
+class FrameClock:
+
+    __instance : Optional['FrameClock'] = None
+
+    @staticmethod
+    def get() -> 'FrameClock':
+        if FrameClock.__instance is None:
+            FrameClock.__instance = FrameClock()
+        return FrameClock.__instance
+
+    @staticmethod
+    def set(clock : 'FrameClock') -> None:
+        FrameClock.__instance = clock
+
+    def __init__(self, fixed_step : Optional[int] = None) -> None:
+        if not fixed_step is None and fixed_step <= 0:
+            raise SystemExit('The frame clock step must be positive.')
+        self.__fixed_step = fixed_step
+        self.__time = 0 if not fixed_step is None else pg.time.get_ticks()
+
+    def advance(self, duration : Optional[int] = None) -> int:
+        if not duration is None:
+            self.__time += duration
+        elif not self.__fixed_step is None:
+            self.__time += self.__fixed_step
+        else:
+            self.__time = max(self.__time, pg.time.get_ticks())
+        return self.__time
+
+    @property
+    def time(self) -> int:
+        return self.__time
+
+    @property
+    def fixed_step(self) -> Optional[int]:
+        return self.__fixed_step
+
+    @property
+    def manual(self) -> bool:
+        return not self.__fixed_step is None
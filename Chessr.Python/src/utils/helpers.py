@@ -1,6 +1,7 @@
-from typing import Any, Iterable, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Iterable, TypeVar, Union
 
-import pygame as pg
+if TYPE_CHECKING:
+    import pygame as pg
 
 Numeric = Union[int, float]
 FloatVector = tuple[float, float]
@@ -11,7 +12,7 @@ Colour = tuple[int, int, int]
 def add_vectors(x : IntVector, y : IntVector) -> IntVector:
     return (x[0] + y[0], x[1] + y[1])
 
-def scale_rect(rect : pg.rect.Rect, scale : float) -> None:
+def scale_rect(rect : 'pg.rect.Rect', scale : float) -> None:
     rect.update(rect.x * scale, rect.y * scale, rect.w * scale, rect.h * scale)
 
 U = TypeVar('U', bound = Numeric)
@@ -1,4 +1,4 @@
-import pygame as pg
+from src.utils.frame_clock import FrameClock
 
 
 class Timer():
@@ -9,19 +9,31 @@ class Timer():
         self.restart()
 
     def restart(self) -> None:
-        self.__start_time = pg.time.get_ticks() + self.__pause
+        self.__start_time = FrameClock.get().time + self.__pause
 
     def has_not_started(self) -> bool:
-        return pg.time.get_ticks() <= self.__start_time
+        return self.has_not_started_at(FrameClock.get().time)
     def finished(self) -> bool:
-        return pg.time.get_ticks() >= self.__start_time + self.__duration
+        return self.finished_at(FrameClock.get().time)
 
     def current_time(self) -> int:
-        if self.has_not_started():
+        return self.current_time_at(FrameClock.get().time)
+
+    def get_percentage_done(self) -> float:
+        return self.get_percentage_done_at(FrameClock.get().time)
+
+    def has_not_started_at(self, time : int) -> bool:
+        return time <= self.__start_time
+
+    def finished_at(self, time : int) -> bool:
+        return time >= self.__start_time + self.__duration
+
+    def current_time_at(self, time : int) -> int:
+        if self.has_not_started_at(time):
             return 0
-        if self.finished():
+        if self.finished_at(time):
             return self.__duration
-        return pg.time.get_ticks() - self.__start_time
+        return time - self.__start_time
 
-    def get_percentage_done(self) -> float:
-        return self.current_time() / float(self.__duration)
+    def get_percentage_done_at(self, time : int) -> float:
+        return self.current_time_at(time) / float(self.__duration)
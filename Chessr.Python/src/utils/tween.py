@@ -1,9 +1,10 @@
 from collections.abc import Sequence
+from threading import Lock
 from typing import Callable, Optional, TypeAlias
 
-from src.utils.helpers import FloatVector
+from src.utils.frame_clock import FrameClock
 from src.utils.timer import Timer
-from src.utils.tween_functions import TweenType, tween
+from src.utils.tween_functions import TweenType, tween, tween_sampled
 
 Tweenable : TypeAlias = float | Sequence[float]
 
@@ -17,23 +18,69 @@ class Tween(Timer):
         duration : int,
         pause : int = 0,
         chain : Optional['Tween'] = None,
-        callback : Optional[Callable[[], None]] = None
+        callback : Optional[Callable[[], None]] = None,
+        lut_resolution : Optional[int] = None
     ) -> None:
-        super().__init__(duration, pause)
         self.__type = tween_type
+        self.__lut_resolution = lut_resolution
         self.__chain = chain
         self.__callback = callback
         self.__start = start if isinstance(start, Sequence) else (start,)
         self.__end = end if isinstance(end, Sequence) else (end,)
-        self.restart()
+        if not len(self.__start) == len(self.__end):
+            raise SystemExit('The tween start and end values must have the same length.')
+        self.__ranges = tuple((x, y - x) for (x, y) in zip(self.__start, self.__end))
+
+        self.__values : tuple[float, ...] = tuple(self.__start)
+        self.__finished = False
+        self.__active = False
+
+        if not chain is None:
+            chain.stop()
+
+        super().__init__(duration, pause)
+
+    def restart(self) -> None:
+        super().restart()
+        self.evaluate(FrameClock.get().time)
+        if not self.__active:
+            self.__active = True
+            TweenManager.get().add(self)
+
+    def stop(self) -> None:
+        self.__active = False
+
+    def finished(self) -> bool:
+        return self.__finished
+
+    def evaluate(self, time : int) -> bool:
+        done = self.get_percentage_done_at(time)
+        if self.__lut_resolution is None:
+            percentage = tween(self.__type, done)
+        else:
+            percentage = tween_sampled(self.__type, done, self.__lut_resolution)
+        self.__values = tuple(x + percentage * d for (x, d) in self.__ranges)
+        self.__finished = self.finished_at(time)
+        return self.__finished
+
+    def complete(self) -> None:
+        self.__active = False
+        if not self.__callback is None:
+            self.__callback()
+        if not self.__chain is None:
+            self.__chain.restart()
+
+    @property
+    def active(self) -> bool:
+        return self.__active
 
     @property
     def value(self) -> float:
-        return self.__get_single_value(self.__get_values())
-    
+        return self.__get_single_value(self.__values)
+
     @property
     def values(self) -> Tweenable:
-        return self.__get_values()
+        return self.__values
 
     @property
     def start_value(self) -> float:
@@ -55,17 +102,7 @@ class Tween(Timer):
         return self.__callback
 
     def get_chained(self) -> Optional['Tween']:
-        if self.__chain is not None:
-            self.__chain.restart()
         return self.__chain
-    
-    def __get_values(self) -> Tweenable:
-        percentage = tween(self.__type, self.get_percentage_done())
-
-        def interpolate(x : FloatVector) -> float:
-            return x[0] + percentage * (x[1] - x[0])
-
-        return tuple(map(interpolate, zip(self.__start, self.__end, strict = True)))
 
     def __get_single_value(self, v : Tweenable) -> float:
         if isinstance(v, float):
@@ -73,3 +110,52 @@ class Tween(Timer):
         if len(v) == 1:
             return v[0]
         raise SystemExit('The tween object had multiple values when one was expected.')
+
+class TweenManager:
+
+    __instance : Optional['TweenManager'] = None
+
+    @staticmethod
+    def get() -> 'TweenManager':
+        if TweenManager.__instance is None:
+            TweenManager.__instance = TweenManager()
+        return TweenManager.__instance
+
+    def __init__(self) -> None:
+        if not TweenManager.__instance is None:
+            raise SystemExit('Invalid initialisation of TweenManager.')
+
+        self.__tweens : dict[Tween, None] = {}
+        self.__pending : list[Tween] = []
+        self.__pending_lock = Lock()
+
+    def add(self, tween_object : Tween) -> None:
+        with self.__pending_lock:
+            self.__pending.append(tween_object)
+
+    def update(self) -> None:
+        with self.__pending_lock:
+            pending, self.__pending = self.__pending, []
+        if len(pending) > 0:
+            self.__tweens.update(dict.fromkeys(pending))
+
+        time = FrameClock.get().time
+        completed : list[Tween] = []
+        for tween_object in self.__tweens:
+            if tween_object.active and tween_object.evaluate(time):
+                completed.append(tween_object)
+
+        self.__tweens = { x : None for x in self.__tweens if x.active and not x.finished() }
+        for tween_object in completed:
+            tween_object.complete()
+
+    def any_running(self) -> bool:
+        with self.__pending_lock:
+            if any(x.active for x in self.__pending):
+                return True
+        time = FrameClock.get().time
+        return any(x.active and not x.finished_at(time) for x in self.__tweens)
+
+    @property
+    def active_count(self) -> int:
+        return len(self.__tweens) + len(self.__pending)
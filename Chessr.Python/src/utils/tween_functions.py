@@ -2,6 +2,7 @@ from __future__ import division
 
 import math
 from enum import auto, unique
+from typing import Callable
 
 from src.utils.enums import ArrayEnum
 
@@ -40,86 +41,49 @@ class TweenType(ArrayEnum):
     EASE_OUT_BOUNCE = auto()
     EASE_IN_OUT_BOUNCE = auto()
 
+DEFAULT_RESOLUTION = 256
+
+__LOOKUP_TABLES : dict[tuple[TweenType, int], tuple[float, ...]] = {}
+
 # Adapted from https://github.com/asweigart/pytweening
 
 def tween(tween_type : TweenType, n : float) -> float:
     if not 0.0 <= n <= 1.0:
         raise SystemExit('The tween argument must be between 0.0 and 1.0.')
+    return __EASING_FUNCTIONS[tween_type](n)
+
+def tween_sampled(tween_type : TweenType, n : float, resolution : int = DEFAULT_RESOLUTION) -> float:
+    if not 0.0 <= n <= 1.0:
+        raise SystemExit('The tween argument must be between 0.0 and 1.0.')
+
+    table = get_lookup_table(tween_type, resolution)
+    position = n * (resolution - 1)
+    index = int(position)
+    if index >= resolution - 1:
+        return table[-1]
+    low = table[index]
+    return low + (position - index) * (table[index + 1] - low)
 
-    if tween_type is TweenType.LINEAR:
-        return n
-
-    if tween_type is TweenType.EASE_IN_QUAD:
-        return n ** 2
-    if tween_type is TweenType.EASE_OUT_QUAD:
-        return -n * (n - 2)
-    if tween_type is TweenType.EASE_IN_OUT_QUAD:
-        return __ease_in_out_quad(n)
-
-    if tween_type is TweenType.EASE_IN_CUBIC:
-        return n ** 3
-    if tween_type is TweenType.EASE_OUT_CUBIC:
-        return (n - 1) ** 3 + 1
-    if tween_type is TweenType.EASE_IN_OUT_CUBIC:
-        return __ease_in_out_cubic(n)
-
-    if tween_type is TweenType.EASE_IN_QUART:
-        return n ** 4
-    if tween_type is TweenType.EASE_OUT_QUART:
-        return -((n - 1) ** 4 - 1)
-    if tween_type is TweenType.EASE_IN_OUT_QUART:
-        return __ease_in_out_quart(n)
-
-    if tween_type is TweenType.EASE_IN_QUINT:
-        return n ** 5
-    if tween_type is TweenType.EASE_OUT_QUINT:
-        return (n - 1) ** 5 + 1
-    if tween_type is TweenType.EASE_IN_OUT_QUINT:
-        return __ease_in_out_quint(n)
-
-    if tween_type is TweenType.EASE_IN_SINE:
-        return -1 * math.cos(n * math.pi / 2) + 1
-    if tween_type is TweenType.EASE_OUT_SINE:
-        return math.sin(n * math.pi / 2)
-    if tween_type is TweenType.EASE_IN_OUT_SINE:
-        return -0.5 * (math.cos(math.pi * n) - 1)
-
-    if tween_type is TweenType.EASE_IN_EXPO:
-        return __ease_in_expo(n)
-    if tween_type is TweenType.EASE_OUT_EXPO:
-        return __ease_out_expo(n)
-    if tween_type is TweenType.EASE_IN_OUT_EXPO:
-        return __ease_in_out_expo(n)
-
-    if tween_type is TweenType.EASE_IN_CIRC:
-        return -1 * (math.sqrt(1 - n * n) - 1)
-    if tween_type is TweenType.EASE_OUT_CIRC:
-        return __ease_out_circ(n)
-    if tween_type is TweenType.EASE_IN_OUT_CIRC:
-        return __ease_in_out_circ(n)
-
-    if tween_type is TweenType.EASE_IN_ELASTIC:
-        return __ease_in_elastic(n)
-    if tween_type is TweenType.EASE_OUT_ELASTIC:
-        return __ease_out_elastic(n)
-    if tween_type is TweenType.EASE_IN_OUT_ELASTIC:
-        return __ease_in_out_elastic(n)
-
-    if tween_type is TweenType.EASE_IN_BACK:
-        return __ease_in_back(n)
-    if tween_type is TweenType.EASE_OUT_BACK:
-        return __ease_out_back(n)
-    if tween_type is TweenType.EASE_IN_OUT_BACK:
-        return __ease_in_out_back(n)
-
-    if tween_type is TweenType.EASE_IN_BOUNCE:
-        return __ease_in_bounce(n)
-    if tween_type is TweenType.EASE_OUT_BOUNCE:
-        return __ease_out_bounce(n)
-    if tween_type is TweenType.EASE_IN_OUT_BOUNCE:
-        return __ease_in_out_bounce(n)
-
-    raise SystemExit(f'Unexpected TweenType \'{tween_type}\'.')
+def get_lookup_table(tween_type : TweenType, resolution : int = DEFAULT_RESOLUTION) -> tuple[float, ...]:
+    if resolution < 2:
+        raise SystemExit('The lookup table resolution must be at least 2.')
+
+    key = (tween_type, resolution)
+    table = __LOOKUP_TABLES.get(key, None)
+    if table is None:
+        function = __EASING_FUNCTIONS[tween_type]
+        table = tuple(function(i / (resolution - 1)) for i in range(resolution))
+        __LOOKUP_TABLES[key] = table
+    return table
+
+def __linear(n : float) -> float:
+    return n
+
+def __ease_in_quad(n : float) -> float:
+    return n ** 2
+
+def __ease_out_quad(n : float) -> float:
+    return -n * (n - 2)
 
 def __ease_in_out_quad(n : float) -> float:
     if n < 0.5:
@@ -127,6 +91,12 @@ def __ease_in_out_quad(n : float) -> float:
     n = n * 2 - 1
     return -0.5 * (n * (n - 2) - 1)
 
+def __ease_in_cubic(n : float) -> float:
+    return n ** 3
+
+def __ease_out_cubic(n : float) -> float:
+    return (n - 1) ** 3 + 1
+
 def __ease_in_out_cubic(n : float) -> float:
     n = 2 * n
     if n < 1:
@@ -134,6 +104,12 @@ def __ease_in_out_cubic(n : float) -> float:
     n = n - 2
     return 0.5 * (n ** 3 + 2)
 
+def __ease_in_quart(n : float) -> float:
+    return n ** 4
+
+def __ease_out_quart(n : float) -> float:
+    return -((n - 1) ** 4 - 1)
+
 def __ease_in_out_quart(n : float) -> float:
     n = 2 * n
     if n < 1:
@@ -141,6 +117,12 @@ def __ease_in_out_quart(n : float) -> float:
     n = n - 2
     return -0.5 * (n**4 - 2)
 
+def __ease_in_quint(n : float) -> float:
+    return n ** 5
+
+def __ease_out_quint(n : float) -> float:
+    return (n - 1) ** 5 + 1
+
 def __ease_in_out_quint(n : float) -> float:
     n = 2 * n
     if n < 1:
@@ -148,6 +130,15 @@ def __ease_in_out_quint(n : float) -> float:
     n = n - 2
     return 0.5 * (n ** 5 + 2)
 
+def __ease_in_sine(n : float) -> float:
+    return -1 * math.cos(n * math.pi / 2) + 1
+
+def __ease_out_sine(n : float) -> float:
+    return math.sin(n * math.pi / 2)
+
+def __ease_in_out_sine(n : float) -> float:
+    return -0.5 * (math.cos(math.pi * n) - 1)
+
 def __ease_in_expo(n : float) -> float:
     if n == 0:
         return 0
@@ -169,6 +160,9 @@ def __ease_in_out_expo(n : float) -> float:
     n -= 1
     return 0.5 * (-1 * (2 ** (-10 * n)) + 2)
 
+def __ease_in_circ(n : float) -> float:
+    return -1 * (math.sqrt(1 - n * n) - 1)
+
 def __ease_out_circ(n : float) -> float:
     n -= 1
     return math.sqrt(1 - (n * n))
@@ -232,3 +226,40 @@ def __ease_in_out_bounce(n : float) -> float:
     if n < 0.5:
         return __ease_in_bounce(n * 2) * 0.5
     return __ease_out_bounce(n * 2 - 1) * 0.5 + 0.5
+
+__EASING_FUNCTIONS : tuple[Callable[[float], float], ...] = (
+    __linear,
+    __ease_in_quad,
+    __ease_out_quad,
+    __ease_in_out_quad,
+    __ease_in_cubic,
+    __ease_out_cubic,
+    __ease_in_out_cubic,
+    __ease_in_quart,
+    __ease_out_quart,
+    __ease_in_out_quart,
+    __ease_in_quint,
+    __ease_out_quint,
+    __ease_in_out_quint,
+    __ease_in_sine,
+    __ease_out_sine,
+    __ease_in_out_sine,
+    __ease_in_expo,
+    __ease_out_expo,
+    __ease_in_out_expo,
+    __ease_in_circ,
+    __ease_out_circ,
+    __ease_in_out_circ,
+    __ease_in_elastic,
+    __ease_out_elastic,
+    __ease_in_out_elastic,
+    __ease_in_back,
+    __ease_out_back,
+    __ease_in_out_back,
+    __ease_in_bounce,
+    __ease_out_bounce,
+    __ease_in_out_bounce
+)
+
+if not len(__EASING_FUNCTIONS) == len(TweenType):
+    raise SystemExit('Every TweenType requires an easing function.')